@@ -1,36 +1,97 @@
 import os
-import json
+
+# Socket.IO server mode - 'threading' by default. Set SOCKETIO_ASYNC_MODE=eventlet (or gevent)
+# to run connections, emits and outbound HTTP as cooperative greenlets; the standard library
+# must be monkey-patched before anything else is imported.
+SOCKETIO_ASYNC_MODE = os.environ.get('SOCKETIO_ASYNC_MODE', 'threading')
+# Optional broker URL (e.g. redis://localhost:6379/0) - lets several server processes
+# share Socket.IO clients, with emits fanned out through the queue
+SOCKETIO_MESSAGE_QUEUE = os.environ.get('SOCKETIO_MESSAGE_QUEUE') or None
+if SOCKETIO_ASYNC_MODE == 'eventlet':
+    import eventlet
+    eventlet.monkey_patch()
+elif SOCKETIO_ASYNC_MODE == 'gevent':
+    from gevent import monkey
+    monkey.patch_all()
+
+import orjson
 import requests
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import date, datetime, timedelta
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
 import re
-from urllib.parse import quote_plus, urlencode
+from urllib.parse import quote_plus, urlencode, urlsplit
 import time
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
 import hashlib
+import sqlite3
+import tempfile
+import queue
+import multiprocessing
+import uuid
+import copy
+from collections import Counter, OrderedDict
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
+from reportlab.platypus import Flowable, SimpleDocTemplate, Paragraph, Spacer, PageBreak
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY
 import io
+import importlib.util
+from functools import lru_cache
 from bs4 import BeautifulSoup
-from flask import Flask, request, jsonify, send_file
+from flask import Flask, Response, request, jsonify, send_file
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from flask_socketio import SocketIO, emit
-from serpapi import GoogleSearch
 import threading
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class OrjsonCodec:
+    """Drop-in for the json module in Socket.IO packet encoding, backed by orjson
+
+    Event payloads carry whole job lists and Gemini-written solutions; orjson encodes
+    them several times faster than the stdlib. Extra stdlib keyword arguments such as
+    separators are accepted and ignored - orjson output is always compact.
+    """
+
+    @staticmethod
+    def dumps(obj, **kwargs) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+    @staticmethod
+    def loads(data, **kwargs):
+        return orjson.loads(data)
+
+class OrjsonJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, for jsonify() responses and request.get_json()
+
+    Keys stay sorted as with Flask's default provider; anything orjson can't encode
+    natively falls back to the default provider's conversions.
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default,
+                            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 # Initialize Flask app
 app = Flask(__name__)
+app.json = OrjsonJSONProvider(app)
 CORS(app)
-socketio = SocketIO(app, cors_allowed_origins="*", async_mode='threading')
+socketio = SocketIO(app, cors_allowed_origins="*", async_mode=SOCKETIO_ASYNC_MODE,
+                    message_queue=SOCKETIO_MESSAGE_QUEUE, json=OrjsonCodec)
 
 # API Keys and configuration
 SERPAPI_API_KEY = ""
@@ -40,36 +101,763 @@ SYSTEM_PROMPT = "You are an AI job search assistant specialized in finding AI/ML
 # Rate limiting
 REQUEST_DELAY = 2  # seconds between requests
 MAX_WORKERS = 3    # concurrent workers
+SERPAPI_BURST = 5  # queries that may go out back-to-back before throttling kicks in
+SCRAPE_WORKERS = 8  # result pages fetched concurrently per interview query
+MAX_HTML_BYTES = 512 * 1024  # questions sit near the top of a page; the rest is comments and footer
+
+class RateLimiter:
+    """Thread-safe token bucket shared by every caller of one upstream API"""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate          # tokens refilled per second
+        self.capacity = capacity  # maximum burst size
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then consume it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+# Same sustained rate as MAX_WORKERS agents each sleeping REQUEST_DELAY between queries
+serpapi_limiter = RateLimiter(rate=MAX_WORKERS / REQUEST_DELAY, capacity=SERPAPI_BURST)
+
+# Gemini solution generation - calls run concurrently but share one request budget
+GEMINI_CONCURRENCY = 5  # solutions generated in parallel
+GEMINI_RATE = 2         # sustained requests per second
+SOLUTION_BATCH_SIZE = 5 # questions answered per Gemini request, kept within the output token limit
+SOLUTION_BATCH_MAX_TOKENS = 8192  # room for SOLUTION_BATCH_SIZE answers of ~500 words each
+gemini_limiter = RateLimiter(rate=GEMINI_RATE, capacity=GEMINI_CONCURRENCY)
+
+# Response caching
+CACHE_DIR = os.environ.get('CACHE_DIR', os.path.join(tempfile.gettempdir(), 'sit_career_cache'))
+SERPAPI_CACHE_TTL = 24 * 3600  # seconds
+SOLUTION_CACHE_TTL = 30 * 24 * 3600  # seconds - generated answers don't go stale like search results
+SOLUTION_MIN_CHARS = 40  # shorter answers are treated as malformed - never cached, re-asked or replaced by the fallback
+ANALYSIS_CACHE_TTL = 6 * 3600  # seconds - market analyses follow the job listings, so they age faster
+INTERVIEW_CACHE_TTL = 3600  # seconds - a repeated interview search replays its last result instead of re-scraping
+ANALYSIS_JOB_BUCKET_SIZE = 10
+ANALYSIS_JOB_BUCKET_MAX = 10  # searches with 100+ jobs all share the top bucket
+ANALYSIS_MIN_JOBS = 5  # fewer jobs than this get the template analysis without a Gemini call
+
+class PersistentTTLCache:
+    """SQLite-backed key/value cache with per-entry expiry, shared across threads and restarts"""
+
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL NOT NULL)'
+            )
+            self._conn.execute('DELETE FROM cache WHERE expires < ?', (time.time(),))
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        """Stable content hash of JSON-serializable key parts"""
+        raw = orjson.dumps(parts, option=orjson.OPT_SORT_KEYS)
+        return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+    def get(self, key: str):
+        """Return the cached value, or None when missing or expired"""
+        try:
+            with self._lock:
+                row = self._conn.execute('SELECT value, expires FROM cache WHERE key = ?', (key,)).fetchone()
+        except sqlite3.Error as e:
+            logger.error(f"Cache read failed: {e}")
+            return None
+
+        if row is None or row[1] < time.time():
+            return None
+        return orjson.loads(row[0])
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Return the live cached values for keys in one query, omitting misses"""
+        if not keys:
+            return {}
+
+        placeholders = ','.join('?' * len(keys))
+        try:
+            with self._lock:
+                rows = self._conn.execute(
+                    f'SELECT key, value FROM cache WHERE expires >= ? AND key IN ({placeholders})',
+                    (time.time(), *keys)
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Cache read failed: {e}")
+            return {}
+
+        return {key: orjson.loads(value) for key, value in rows}
+
+    def set(self, key: str, value, ttl: float):
+        """Store a JSON-serializable value for ttl seconds"""
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO cache (key, value, expires) VALUES (?, ?, ?)',
+                    (key, orjson.dumps(value), time.time() + ttl)
+                )
+        except sqlite3.Error as e:
+            logger.error(f"Cache write failed: {e}")
+
+serpapi_cache = PersistentTTLCache(os.path.join(CACHE_DIR, 'serpapi.sqlite3'))
+solution_cache = PersistentTTLCache(os.path.join(CACHE_DIR, 'solutions.sqlite3'))
+analysis_cache = PersistentTTLCache(os.path.join(CACHE_DIR, 'analyses.sqlite3'))
+interview_cache = PersistentTTLCache(os.path.join(CACHE_DIR, 'interviews.sqlite3'))
+
+# Shared HTTP client - one pooled keep-alive session reused by every agent so
+# repeat queries skip the TCP+TLS handshake
+SERPAPI_ENDPOINT = "https://serpapi.com/search.json"
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+HTTP_POOL_CONNECTIONS = 32  # distinct hosts kept warm
+HTTP_POOL_MAXSIZE = 64      # keep-alive connections per host, enough for every concurrent agent and scraper
+
+http_session = requests.Session()
+http_session.headers.update({'User-Agent': USER_AGENT, 'Accept-Encoding': 'gzip, deflate'})
+_http_adapter = HTTPAdapter(
+    pool_connections=HTTP_POOL_CONNECTIONS,
+    pool_maxsize=HTTP_POOL_MAXSIZE,
+    # Transient upstream failures are retried with backoff; the final response is still returned
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                      raise_on_status=False)
+)
+http_session.mount('https://', _http_adapter)
+http_session.mount('http://', _http_adapter)
+
+# Gemini gets its own pool so generation POSTs can be retried: a 429/503 means the request
+# was rejected before generation, and Retry honours the Retry-After the API sends back.
+# Only those statuses are retried - after a connection or read error the prompt may
+# already be generating (and billed), so the error is surfaced instead.
+gemini_session = requests.Session()
+gemini_session.mount('https://', HTTPAdapter(
+    pool_maxsize=GEMINI_CONCURRENCY,  # one keep-alive connection per concurrent generation
+    max_retries=Retry(total=3, connect=0, read=0, other=0, status=3, backoff_factor=1,
+                      status_forcelist=[429, 503], allowed_methods=frozenset(['POST']),
+                      raise_on_status=False)
+))
+
+# Errors that fail one search query - a network error, an unparsable body, or a
+# reply whose shape the result parsers don't expect - without losing earlier pages
+SEARCH_QUERY_ERRORS = (requests.RequestException, ValueError, KeyError, TypeError, AttributeError)
+
+def serpapi_search(params: Dict, use_cache: bool = True) -> Dict:
+    """Run a rate-limited SerpAPI query over the shared session and return the JSON body
+
+    Successful responses are cached for SERPAPI_CACHE_TTL, so repeating a search
+    for the same role/location or domain is answered without a network round-trip.
+    """
+    cache_key = PersistentTTLCache.make_key(params)
+    if use_cache:
+        cached = serpapi_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    serpapi_limiter.acquire()
+    response = http_session.get(
+        SERPAPI_ENDPOINT,
+        params={**params, "api_key": SERPAPI_API_KEY},
+        timeout=30
+    )
+    # orjson decodes the raw bytes directly, several times faster than response.json()
+    results = orjson.loads(response.content)
+
+    if response.status_code == 200 and 'error' not in results:
+        serpapi_cache.set(cache_key, results, SERPAPI_CACHE_TTL)
+    return results
+
+GEMINI_ENDPOINT = "https://generativelanguage.googleapis.com/v1beta/models/gemini-1.5-flash:generateContent"
+
+def gemini_generate(prompt: str, timeout: int = 30, generation_config: Optional[Dict] = None) -> str:
+    """Run one rate-limited generateContent call over the shared Gemini session and return the reply text
+
+    Raises on a non-200 response, after gemini_session has retried 429/503 with backoff.
+    """
+    payload = {"contents": [{"parts": [{"text": prompt}]}]}
+    if generation_config:
+        payload["generationConfig"] = generation_config
+
+    gemini_limiter.acquire()
+    response = gemini_session.post(
+        GEMINI_ENDPOINT,
+        params={"key": GEMINI_API_KEY},
+        data=orjson.dumps(payload),
+        headers={'Content-Type': 'application/json'},
+        timeout=timeout
+    )
+    if response.status_code != 200:
+        raise Exception(f"Gemini API error: {response.status_code} - {response.text}")
+
+    result = orjson.loads(response.content)
+    return result['candidates'][0]['content']['parts'][0]['text']
+
+# Gemini prompt templates - the static text is built once at import and each call
+# only fills in its fields
+SOLUTION_PROMPT = """
+You are an expert technical interviewer and educator. Provide a comprehensive answer to this {domain} interview question{company_context}:
+
+**Question:** {question}
+
+**Context:**
+- Domain: {domain}
+- Difficulty Level: {difficulty}
+- Question Type: {question_type}
+- Target Audience: Fresh graduates and 4th year students from Indian engineering colleges
+
+Please provide a structured response with:
+
+## 1. Concept Explanation
+- Clear explanation of the underlying concept
+- Key terminology and definitions
+- Why this concept is important in {domain}
+
+## 2. Detailed Solution
+- Step-by-step approach to solve this problem
+- Multiple approaches if applicable (brute force, optimized, etc.)
+- Time and space complexity analysis (if applicable)
+
+## 3. Code Implementation (if applicable)
+- Clean, well-commented code in Python or Java
+- Include input/output examples
+- Handle edge cases
+
+## 4. Key Points for Interview
+- Important points to remember and mention
+- Common mistakes to avoid
+- Follow-up questions you might be asked
+
+## 5. Related Concepts
+- Connected topics you should know
+- How this fits into the broader {domain} landscape
+
+Keep the explanation:
+- Beginner-friendly but technically accurate
+- Focused on Indian job market expectations
+- Include practical examples where possible
+- Maximum 500 words for clarity
+
+Format the response in clean markdown with proper headers and code blocks.
+"""
+
+BATCH_SOLUTION_PROMPT = """
+You are an expert technical interviewer and educator. Provide a comprehensive answer to each of these {count} {domain} interview questions{company_context}:
+
+{question_lines}
+
+**Context:**
+- Domain: {domain}
+- Target Audience: Fresh graduates and 4th year students from Indian engineering colleges
+
+Each answer should be structured markdown with:
+
+## 1. Concept Explanation
+- Clear explanation of the underlying concept, key terminology, and why it matters in {domain}
+
+## 2. Detailed Solution
+- Step-by-step approach, multiple approaches if applicable, and time/space complexity (if applicable)
+
+## 3. Code Implementation (if applicable)
+- Clean, well-commented code in Python or Java with input/output examples and edge cases
+
+## 4. Key Points for Interview
+- Points to mention, common mistakes, and likely follow-up questions
+
+## 5. Related Concepts
+- Connected topics and how this fits into the broader {domain} landscape
+
+Keep every answer beginner-friendly but technically accurate, focused on Indian job market expectations, and under 500 words.
+
+Respond with a JSON array of exactly {count} objects, one per question in the order given:
+[{{"id": <question number>, "solution": "<markdown answer>"}}]
+"""
+
+MARKET_ANALYSIS_PROMPT = """
+            Analyze the job market for "{job_role}" AI/ML positions in Pune for Symbiosis Institute of Technology 4th year students and fresh graduates.
+
+            Job Search Data Summary:
+            - Total jobs found: {total_jobs}
+            - Sources searched: {sources}
+            - Sample job titles: {sample_titles}
+
+            Provide a comprehensive analysis including:
+
+            ## Market Overview
+            Current demand and supply for {job_role} positions in Pune AI/ML market.
+
+            ## Salary Expectations
+            Expected salary ranges for fresh graduates in {job_role} positions (in INR/LPA).
+
+            ## Top Hiring Companies
+            Companies actively hiring for {job_role} roles in Pune.
+
+            ## Essential Skills
+            Most sought-after technical and soft skills for {job_role} positions.
+
+            ## Career Growth Path
+            Typical career progression for freshers starting in {job_role}.
+
+            ## Application Strategy
+            Practical tips to improve chances of getting hired in {job_role}.
+
+            ## Industry Trends
+            Current AI/ML industry trends affecting {job_role} opportunities.
+
+            ## Action Items for Students
+            Specific recommendations for SIT Pune students to prepare for {job_role} roles.
+
+            Keep the analysis practical, actionable, and focused on the Indian job market.
+            """
+
+# Response and event timestamps - formatted at most once per second, however many
+# progress updates are sent in that second
+_iso_second: Tuple[int, str] = (0, '')
+
+def now_iso() -> str:
+    """Current local time as an ISO 8601 string, to the second"""
+    global _iso_second
+    second = int(time.time())
+    cached_second, text = _iso_second
+    if cached_second != second:
+        text = datetime.fromtimestamp(second).isoformat()
+        _iso_second = (second, text)
+    return text
+
+# Search progress events - search and scrape threads enqueue and return immediately;
+# one background task owns the Socket.IO transport and emits in order, so a
+# search's final result can never overtake its own progress updates
+EVENT_QUEUE_SIZE = 1024
+
+_event_queue: "queue.Queue[Tuple[str, Dict]]" = queue.Queue(maxsize=EVENT_QUEUE_SIZE)
+_event_flusher_started = False
+_event_flusher_lock = threading.Lock()
+
+def _flush_events():
+    """Emit queued events to connected clients, forever
+
+    Each wake-up drains everything queued since the last one, so a burst of updates
+    from parallel scrapers costs one context switch rather than one per event.
+    """
+    while True:
+        pending = [_event_queue.get()]
+        try:
+            while True:
+                pending.append(_event_queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        for event, payload in pending:
+            try:
+                socketio.emit(event, payload)
+            except Exception as e:
+                logger.error(f"Failed to emit {event}: {e}")
+
+def queue_event(event: str, payload: Dict, final: bool = False):
+    """Queue a Socket.IO event for the frontend without blocking on socket I/O
+
+    Progress updates are dropped if the queue is full; final events (a search's
+    result or failure) wait for room instead, since the frontend depends on them.
+    """
+    global _event_flusher_started
+    if not _event_flusher_started:
+        with _event_flusher_lock:
+            if not _event_flusher_started:
+                socketio.start_background_task(_flush_events)
+                _event_flusher_started = True
+
+    if final:
+        _event_queue.put((event, payload))
+        return
+    try:
+        _event_queue.put_nowait((event, payload))
+    except queue.Full:
+        logger.warning("Event queue full, dropping %s update: %s", event, payload.get('message'))
+
+def queue_thought(payload: Dict):
+    """Queue a 'thought' status update for the frontend"""
+    queue_event('thought', payload)
+
+# Precompiled patterns - compiled once at import instead of on every parsed result
+def _compile_keywords(keywords: List[str]) -> re.Pattern:
+    """Compile a keyword list into a single case-insensitive whole-word alternation"""
+    alternation = '|'.join(re.escape(k) for k in sorted(keywords, key=len, reverse=True))
+    return re.compile(r'\b(' + alternation + r')\b', re.IGNORECASE)
+
+class KeywordSet:
+    """Substring keywords matched against text with one compiled scan instead of one scan per keyword"""
+
+    def __init__(self, keywords: List[str]):
+        ordered = sorted(set(keywords), key=len, reverse=True)
+        alternation = '|'.join(re.escape(k) for k in ordered)
+        self._any_re = re.compile(alternation)
+        # Zero-width scan that reports the longest keyword starting at every position
+        self._each_re = re.compile(f'(?=({alternation}))')
+        # Shorter keywords that are prefixes of each keyword - they occur wherever it does
+        self._prefixes = {k: frozenset(p for p in ordered if p != k and k.startswith(p)) for k in ordered}
+
+    def search(self, text: str) -> bool:
+        """True if any keyword occurs in text"""
+        return self._any_re.search(text) is not None
+
+    def count(self, text: str) -> int:
+        """Number of distinct keywords occurring in text"""
+        found = set()
+        for match in self._each_re.finditer(text):
+            keyword = match.group(1)
+            if keyword not in found:
+                found.add(keyword)
+                found |= self._prefixes[keyword]
+        return len(found)
+
+_WHITESPACE_RE = re.compile(r'\s+')
+# Every salary and posting-date pattern needs a digit, so one scan for one rules them all out
+_DIGIT_RE = re.compile(r'\d')
+
+# LinkedIn extraction patterns
+_LINKEDIN_COMPANY_RES = tuple(re.compile(p, re.IGNORECASE) for p in [
+    r'at\s+([^-|•]+?)(?:\s*-|\s*\||\s*•|$)',
+    r'-\s+([^|•]+?)(?:\s*\||\s*•|$)',
+    r'•\s+([^•|]+?)(?:\s*-|\s*\||\s*•|$)',
+    r'\|\s+([^|]+?)(?:\s*-|\s*•|$)'
+])
+# Titles/descriptions mentioning any of these count as AI/ML roles
+_AI_ML_KEYWORDS_RE = _compile_keywords(['ai', 'ml', 'machine learning', 'artificial intelligence',
+                                        'data science', 'nlp', 'computer vision', 'deep learning'])
+# Candidate company names containing these words are listing noise, not employers
+_COMPANY_NOISE_RE = re.compile(r'hiring|jobs|careers', re.IGNORECASE)
+_LINKEDIN_DATE_RES = tuple(re.compile(p, re.IGNORECASE) for p in [
+    r'(\d+)\s+days?\s+ago',
+    r'(\d+)\s+hours?\s+ago',
+    r'Posted\s+(\d+)\s+days?\s+ago',
+    r'(\d+)d\s+ago',
+    r'(\d+)h\s+ago'
+])
+_LINKEDIN_SALARY_RES = tuple(re.compile(p, re.IGNORECASE) for p in [
+    r'₹\s*[\d,]+\s*-\s*₹?\s*[\d,]+(?:\s*(?:per|/)\s*(?:month|annum|year))?',
+    r'Rs\.?\s*[\d,]+\s*-\s*[\d,]+',
+    r'\$\s*[\d,]+\s*-\s*\$?\s*[\d,]+',
+    r'\d+\s*-\s*\d+\s*LPA',
+    r'\d+\s*LPA',
+    r'\d+\s*lakhs?\s*(?:per\s*)?(?:annum|year)?'
+])
+
+# Naukri extraction patterns
+_NAUKRI_SALARY_RES = tuple(re.compile(p, re.IGNORECASE) for p in [
+    r'₹\s*[\d,]+\s*-\s*₹?\s*[\d,]+',
+    r'Rs\.?\s*[\d,]+\s*-\s*[\d,]+',
+    r'\d+\s*-\s*\d+\s*LPA',
+    r'\d+\s*LPA',
+    r'\d+\s*lakhs?'
+])
+_NAUKRI_SNIPPET_NOISE_RE = re.compile(r'job|hiring|experience|salary', re.IGNORECASE)
+_NAUKRI_DATE_RES = tuple(re.compile(p, re.IGNORECASE) for p in [
+    r'(\d+)\s+days?\s+ago',
+    r'posted\s+(\d+)\s+days?\s+ago'
+])
+
+# Indeed extraction patterns
+_INDEED_SALARY_RES = tuple(re.compile(p, re.IGNORECASE) for p in [
+    r'₹\s*[\d,]+\s*-\s*₹?\s*[\d,]+',
+    r'\$\s*[\d,]+\s*-\s*\$?\s*[\d,]+',
+    r'\d+\s*LPA'
+])
+
+# Job source URLs - a result link is classified by looking its host and each parent
+# domain up in one table, so every source costs the same dict probe
+_JOB_SOURCE_HOSTS = {
+    'linkedin.com': 'linkedin',
+    'naukri.com': 'naukri',
+    'indeed.co.in': 'indeed',
+    'indeed.com': 'indeed',
+    'freshersworld.com': 'freshersworld',
+    'monster.co.in': 'monster',
+}
+# LinkedIn links only count as listings under these paths (jobs and recruiter profiles)
+_LINKEDIN_JOB_PATHS = ('/jobs', '/in/')
+
+def _parent_domains(host: str) -> List[str]:
+    """host followed by each parent domain down to two labels, e.g. in.glassdoor.com, glassdoor.com"""
+    labels = host.split('.')
+    return ['.'.join(labels[i:]) for i in range(len(labels) - 1)]
+
+def _match_host_suffix(host: str, table: Dict[str, Any]) -> Optional[Any]:
+    """Return the table entry for host or its nearest listed parent domain"""
+    for domain in _parent_domains(host):
+        value = table.get(domain)
+        if value is not None:
+            return value
+    return None
+
+def _url_host(url: str) -> str:
+    """Lowercased hostname of an http(s) URL, or '' for anything else"""
+    try:
+        parts = urlsplit(url)
+        host = parts.hostname
+    except ValueError:
+        return ''
+    if parts.scheme not in ('http', 'https') or not host:
+        return ''
+    return host
+
+def _job_source_of(url: str) -> Optional[str]:
+    """Return the job source a result URL belongs to, or None"""
+    host = _url_host(url) if url else ''
+    if not host:
+        return None
+
+    source = _match_host_suffix(host, _JOB_SOURCE_HOSTS)
+    if source == 'linkedin' and not urlsplit(url).path.lower().startswith(_LINKEDIN_JOB_PATHS):
+        return None
+    return source
+
+# Posting dates - "N days ago" is resolved through a per-day table instead of a
+# datetime.now() + strftime() per parsed result
+POSTED_DATE_WINDOW = 90  # days
+
+@lru_cache(maxsize=2)
+def _posted_date_table(today: date) -> Dict[int, str]:
+    """Map 'days ago' to a YYYY-MM-DD string for the given day"""
+    return {days: (today - timedelta(days=days)).isoformat() for days in range(POSTED_DATE_WINDOW)}
+
+def _posted_date(today: date, days_ago: int) -> str:
+    """Return the YYYY-MM-DD date that was days_ago days before today"""
+    posted = _posted_date_table(today).get(days_ago)
+    return posted or (today - timedelta(days=days_ago)).isoformat()
+
+# Skills shared by every job source, in display casing and reporting order
+SKILL_KEYWORDS = [
+    'Python', 'Java', 'JavaScript', 'React', 'Node.js', 'Django', 'Flask',
+    'TensorFlow', 'PyTorch', 'Scikit-learn', 'Pandas', 'NumPy',
+    'Machine Learning', 'Deep Learning', 'NLP', 'Computer Vision',
+    'AI', 'ML', 'Artificial Intelligence', 'Data Science', 'SQL', 'MongoDB',
+    'AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'Git'
+]
+_SKILL_BY_KEY = {skill.lower(): skill for skill in SKILL_KEYWORDS}
+_SKILLS_RE = _compile_keywords(SKILL_KEYWORDS)
+
+# Interview question extraction patterns
+QUESTION_PATTERNS = [
+    # Direct question formats
+    r'Q\d*[.:\s]*(.+\?)',
+    r'Question\s*\d*[.:\s]*(.+\?)',
+    r'(\d+\.\s*.+\?)',
+
+    # Interview experience patterns
+    r'(?:asked|question was|interviewer asked)[:\s]*(.+\?)',
+    r'(?:They asked|He asked|She asked)[:\s]*(.+\?)',
+
+    # Leetcode/Coding platform patterns
+    r'Problem[:\s]*(.+\?)',
+    r'Challenge[:\s]*(.+\?)',
+
+    # Technical question patterns
+    r'((?:What|How|Why|When|Where|Which|Can|Do|Does|Is|Are|Will|Would|Should|Could|Have|Has|Did|Explain|Describe|Define|List|Name|Tell|Write|Find|Calculate|Solve|Compare|Analyze|Discuss|Evaluate|Implement|Design|Create)\s+[^?.!]+\?)',
+
+    # Code-related questions
+    r'(Write\s+(?:a\s+)?(?:function|code|program|algorithm|method)\s+(?:to|for|that)\s+[^?.!]+\?)',
+    r'(Implement\s+[^?.!]+\?)',
+    r'(Design\s+[^?.!]+\?)',
+
+    # System design patterns
+    r'(How\s+would\s+you\s+(?:design|build|implement|create)\s+[^?.!]+\?)',
+]
+_QUESTION_RES = tuple(re.compile(p, re.IGNORECASE | re.MULTILINE) for p in QUESTION_PATTERNS)
+# Literals each pattern above cannot match without (any one of them, case-folded);
+# an empty tuple means the pattern always runs. Checked with a substring scan so
+# most patterns are skipped on text that could never match them.
+QUESTION_PATTERN_GUARDS = [
+    ('q',),
+    ('question',),
+    ('.',),
+    ('asked', 'question was'),
+    ('he asked', 'they asked'),
+    ('problem',),
+    ('challenge',),
+    (),
+    ('write',),
+    ('implement',),
+    ('design',),
+    ('how',),
+]
+_QUESTION_MATCHERS = tuple(zip(QUESTION_PATTERN_GUARDS, _QUESTION_RES))
+# Characters that never belong in an extracted question
+_QUESTION_NOISE_RE = re.compile(r'[^\w\s\?\.\!\-\(\),;:]')
+# Company named in the context around a question
+_QUESTION_COMPANY_RES = tuple(re.compile(p) for p in [
+    r'(?:at|in|during|from)\s+([A-Z][a-zA-Z\s&.]+?)(?:\s+interview|\s+asked|\s|,|\.|$)',
+    r'([A-Z][a-zA-Z\s&.]+?)\s+(?:interview|asked|company)',
+    r'(?:asked\s+at|interviewed\s+at)\s+([A-Z][a-zA-Z\s&.]+?)(?:\s|,|\.|$)'
+])
+_QUESTION_YEAR_RE = re.compile(r'\b(202[0-5]|201[5-9])\b')
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+
+def _question_key(question_text: str) -> str:
+    """Normalized form of a question used to spot duplicates"""
+    normalized = _NON_WORD_RE.sub('', question_text.lower().strip())
+    return _WHITESPACE_RE.sub(' ', normalized)
+
+# Markdown code fence Gemini sometimes wraps JSON replies in
+_JSON_FENCE_RE = re.compile(r'^\s*```(?:json)?\s*|\s*```\s*$', re.IGNORECASE)
+
+def _is_usable_solution(solution) -> bool:
+    """Whether a generated answer is substantial enough to show and cache"""
+    return isinstance(solution, str) and len(solution.strip()) >= SOLUTION_MIN_CHARS
+
+def _batch_solutions_from_reply(text: str, batch_size: int) -> Dict[int, str]:
+    """Map batch positions to answers in a batch-solution reply
+
+    Accepts the requested [{"id", "solution"}] array, or that array as the only list
+    inside an object. Ids must be integers in 1..batch_size with no repeats; without
+    ids, entries (objects or bare strings) are matched by position only when there is
+    exactly one per question. Anything else returns {} rather than risk attaching
+    answers to the wrong questions, so the whole batch falls back to per-question calls.
+    Answers shorter than SOLUTION_MIN_CHARS are left out.
+    """
+    items = orjson.loads(_JSON_FENCE_RE.sub('', text))
+    if isinstance(items, dict):
+        lists = [value for value in items.values() if isinstance(value, list)]
+        items = lists[0] if len(lists) == 1 else None
+    if not isinstance(items, list):
+        return {}
+
+    if any(isinstance(item, dict) and 'id' in item for item in items):
+        answers = {}
+        for item in items:
+            answer_id = item.get('id') if isinstance(item, dict) else None
+            if type(answer_id) is not int or not 1 <= answer_id <= batch_size or answer_id - 1 in answers:
+                return {}
+            answers[answer_id - 1] = item.get('solution')
+    elif len(items) == batch_size:
+        answers = {position: item.get('solution') if isinstance(item, dict) else item
+                   for position, item in enumerate(items)}
+    else:
+        return {}
+
+    return {index: answer.strip() for index, answer in answers.items() if _is_usable_solution(answer)}
+
+def _solution_cache_key(question: str, domain: str, company: Optional[str], difficulty: str, question_type: str) -> str:
+    """solution_cache key for a question and the prompt context it is answered in"""
+    return PersistentTTLCache.make_key(_question_key(question), domain, company, difficulty, question_type)
+
+# Memoized extractors - the query variants of one source return overlapping
+# results, so the same titles and snippets are parsed again and again
+EXTRACTOR_CACHE_SIZE = 4096
+
+@lru_cache(maxsize=EXTRACTOR_CACHE_SIZE)
+def _skills_in(text: str) -> Tuple[str, ...]:
+    """Skills mentioned in text, in SKILL_KEYWORDS order"""
+    found = {match.lower() for match in _SKILLS_RE.findall(text)}
+    return tuple(skill for key, skill in _SKILL_BY_KEY.items() if key in found)
+
+@lru_cache(maxsize=EXTRACTOR_CACHE_SIZE)
+def _linkedin_company_from_title(title: str) -> str:
+    """Company name from a LinkedIn result title"""
+    # Clean title first
+    title = _WHITESPACE_RE.sub(' ', title).strip()
+
+    # Common patterns in LinkedIn job titles
+    for pattern in _LINKEDIN_COMPANY_RES:
+        match = pattern.search(title)
+        if match:
+            company = match.group(1).strip()
+            if len(company) > 2 and not _COMPANY_NOISE_RE.search(company):
+                return company
+
+    # Fallback: try to extract from end of title
+    parts = title.split(' - ')
+    if len(parts) > 1:
+        potential_company = parts[-1].strip()
+        if len(potential_company) > 2:
+            return potential_company
+
+    return "Company Not Specified"
+
+@lru_cache(maxsize=EXTRACTOR_CACHE_SIZE)
+def _job_type_of(title: str) -> str:
+    """Job type implied by a job title"""
+    title_lower = title.lower()
+    if any(word in title_lower for word in ['intern', 'internship']):
+        return 'Internship'
+    elif any(word in title_lower for word in ['contract', 'freelance', 'consultant']):
+        return 'Contract'
+    elif any(word in title_lower for word in ['part-time', 'part time']):
+        return 'Part-time'
+    else:
+        return 'Full-time'
 
 class JobSearchAPI:
     """Base class for job search APIs"""
     
+    # Source-specific extraction patterns, tried in order - overridden by subclasses
+    salary_patterns: Tuple[re.Pattern, ...] = ()
+    date_patterns: Tuple[re.Pattern, ...] = ()
+
     def __init__(self, source_name: str):
         self.source_name = source_name
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        self.session = http_session
     
     def emit_status(self, message: str, status: str = "info"):
         """Emit status to frontend"""
-        try:
-            socketio.emit('thought', {
-                'agent': f'{self.source_name} Agent',
-                'message': message,
-                'status': status,
-                'timestamp': datetime.now().isoformat()
-            })
-        except Exception as e:
-            logger.error(f"Failed to emit status: {e}")
+        queue_thought({
+            'agent': f'{self.source_name} Agent',
+            'message': message,
+            'status': status,
+            'timestamp': now_iso()
+        })
     
     def search_jobs(self, job_role: str, location: str = "Pune", **kwargs) -> List[Dict]:
         """Base search method - to be implemented by subclasses"""
         raise NotImplementedError
 
+    def _extract_skills(self, text: str) -> List[str]:
+        """Extract relevant skills from text in a single pass over the shared skill list"""
+        return list(_skills_in(text)[:5])  # Limit to top 5 skills
+
+    def _extract_salary(self, text: str) -> str:
+        """Extract salary information using the first matching source pattern"""
+        if not _DIGIT_RE.search(text):
+            return "Not Disclosed"
+
+        for pattern in self.salary_patterns:
+            match = pattern.search(text)
+            if match:
+                return match.group(0).strip()
+
+        return "Not Disclosed"
+
+    def _extract_date(self, text: str, today: date) -> str:
+        """Extract posting date from relative 'N days/hours ago' text"""
+        if not _DIGIT_RE.search(text):
+            return today.isoformat()
+
+        for pattern in self.date_patterns:
+            match = pattern.search(text)
+            if match:
+                try:
+                    days_ago = int(match.group(1))
+                    if 'hour' in match.group(0) or 'h' in match.group(0):
+                        days_ago = 0
+                    return _posted_date(today, days_ago)
+                except:
+                    continue
+
+        return today.isoformat()
+
 class LinkedInJobAPI(JobSearchAPI):
     """Enhanced LinkedIn job scraping and search"""
     
+    salary_patterns = _LINKEDIN_SALARY_RES
+    date_patterns = _LINKEDIN_DATE_RES
+
     def __init__(self):
         super().__init__("LinkedIn")
         self.base_url = "https://www.linkedin.com"
@@ -79,6 +867,7 @@ class LinkedInJobAPI(JobSearchAPI):
         """Search LinkedIn jobs with multiple methods"""
         self.emit_status("Starting LinkedIn job search...")
         jobs = []
+        today = date.today()  # Resolved once per search for every posted_date
         
         try:
             # Enhanced search queries for better results
@@ -94,8 +883,7 @@ class LinkedInJobAPI(JobSearchAPI):
                 self.emit_status(f"Searching LinkedIn - Query {i+1}/3")
                 
                 try:
-                    search = GoogleSearch({
-                        "api_key": SERPAPI_API_KEY,
+                    results = serpapi_search({
                         "engine": "google",
                         "q": query,
                         "num": 8,
@@ -104,18 +892,20 @@ class LinkedInJobAPI(JobSearchAPI):
                         "safe": "off"
                     })
                     
-                    results = search.get_dict()
-                    
-                    if 'organic_results' in results:
-                        for result in results['organic_results']:
-                            if self._is_linkedin_job(result.get('link', '')):
-                                job = self._parse_linkedin_result(result, location, experience_level)
-                                if job and self._is_relevant_job(job, job_role):
-                                    jobs.append(job)
+                    organic_results = results.get('organic_results')
+                    if not organic_results:
+                        continue
                     
-                    time.sleep(REQUEST_DELAY)  # Rate limiting
+                    for result in organic_results:
+                        link = result.get('link') or ''
+                        if not link:
+                            continue
+                        if self._is_linkedin_job(link):
+                            job = self._parse_linkedin_result(result, location, experience_level, today)
+                            if job and self._is_relevant_job(job, job_role):
+                                jobs.append(job)
                     
-                except Exception as e:
+                except SEARCH_QUERY_ERRORS as e:
                     self.emit_status(f"Query {i+1} failed: {str(e)}", "warning")
                     continue
             
@@ -129,9 +919,9 @@ class LinkedInJobAPI(JobSearchAPI):
     
     def _is_linkedin_job(self, url: str) -> bool:
         """Check if URL is a LinkedIn job"""
-        return url and ('linkedin.com/jobs' in url or 'linkedin.com/in/' in url)
+        return _job_source_of(url) == 'linkedin'
     
-    def _parse_linkedin_result(self, result: Dict, location: str, experience_level: str) -> Optional[Dict]:
+    def _parse_linkedin_result(self, result: Dict, location: str, experience_level: str, today: date) -> Optional[Dict]:
         """Parse LinkedIn search result"""
         try:
             title = result.get('title', '').replace(' - LinkedIn', '').replace(' | LinkedIn', '')
@@ -149,7 +939,7 @@ class LinkedInJobAPI(JobSearchAPI):
                 'source': 'LinkedIn',
                 'job_type': self._determine_job_type(title),
                 'experience_level': experience_level,
-                'posted_date': self._extract_date(snippet),
+                'posted_date': self._extract_date(snippet, today),
                 'salary': self._extract_salary(snippet),
                 'skills': self._extract_skills(title + ' ' + snippet)
             }
@@ -162,123 +952,31 @@ class LinkedInJobAPI(JobSearchAPI):
     
     def _extract_company_from_title(self, title: str) -> str:
         """Extract company name from job title"""
-        # Clean title first
-        title = re.sub(r'\s+', ' ', title).strip()
-        
-        # Common patterns in LinkedIn job titles
-        patterns = [
-            r'at\s+([^-|•]+?)(?:\s*-|\s*\||\s*•|$)',
-            r'-\s+([^|•]+?)(?:\s*\||\s*•|$)',
-            r'•\s+([^•|]+?)(?:\s*-|\s*\||\s*•|$)',
-            r'\|\s+([^|]+?)(?:\s*-|\s*•|$)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, title, re.IGNORECASE)
-            if match:
-                company = match.group(1).strip()
-                if len(company) > 2 and not any(word in company.lower() for word in ['hiring', 'jobs', 'careers']):
-                    return company
-        
-        # Fallback: try to extract from end of title
-        parts = title.split(' - ')
-        if len(parts) > 1:
-            potential_company = parts[-1].strip()
-            if len(potential_company) > 2:
-                return potential_company
-        
-        return "Company Not Specified"
+        return _linkedin_company_from_title(title)
     
     def _determine_job_type(self, title: str) -> str:
         """Determine job type from title"""
-        title_lower = title.lower()
-        if any(word in title_lower for word in ['intern', 'internship']):
-            return 'Internship'
-        elif any(word in title_lower for word in ['contract', 'freelance', 'consultant']):
-            return 'Contract'
-        elif any(word in title_lower for word in ['part-time', 'part time']):
-            return 'Part-time'
-        else:
-            return 'Full-time'
-    
-    def _extract_date(self, text: str) -> str:
-        """Extract posting date from text"""
-        date_patterns = [
-            r'(\d+)\s+days?\s+ago',
-            r'(\d+)\s+hours?\s+ago',
-            r'Posted\s+(\d+)\s+days?\s+ago',
-            r'(\d+)d\s+ago',
-            r'(\d+)h\s+ago'
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                try:
-                    days_ago = int(match.group(1))
-                    if 'hour' in match.group(0) or 'h' in match.group(0):
-                        days_ago = 0
-                    date = datetime.now() - timedelta(days=days_ago)
-                    return date.strftime('%Y-%m-%d')
-                except:
-                    continue
-        
-        return datetime.now().strftime('%Y-%m-%d')
-    
-    def _extract_salary(self, text: str) -> str:
-        """Extract salary information"""
-        salary_patterns = [
-            r'₹\s*[\d,]+\s*-\s*₹?\s*[\d,]+(?:\s*(?:per|/)\s*(?:month|annum|year))?',
-            r'Rs\.?\s*[\d,]+\s*-\s*[\d,]+',
-            r'\$\s*[\d,]+\s*-\s*\$?\s*[\d,]+',
-            r'\d+\s*-\s*\d+\s*LPA',
-            r'\d+\s*LPA',
-            r'\d+\s*lakhs?\s*(?:per\s*)?(?:annum|year)?'
-        ]
-        
-        for pattern in salary_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(0).strip()
-        
-        return "Not Disclosed"
-    
-    def _extract_skills(self, text: str) -> List[str]:
-        """Extract relevant skills from text"""
-        skills = []
-        skill_keywords = [
-            'python', 'java', 'javascript', 'react', 'node.js', 'django', 'flask',
-            'tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy',
-            'machine learning', 'deep learning', 'nlp', 'computer vision',
-            'ai', 'artificial intelligence', 'data science', 'sql', 'mongodb',
-            'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'git'
-        ]
-        
-        text_lower = text.lower()
-        for skill in skill_keywords:
-            if skill in text_lower:
-                skills.append(skill.title())
-        
-        return skills[:5]  # Limit to top 5 skills
+        return _job_type_of(title)
     
     def _is_relevant_job(self, job: Dict, job_role: str) -> bool:
         """Check if job is relevant to the search"""
-        title = job.get('title', '').lower()
-        description = job.get('description', '').lower()
-        job_role_lower = job_role.lower()
+        title = job.get('title', '')
+        description = job.get('description', '')
         
-        # Check for AI/ML relevance
-        ai_ml_keywords = ['ai', 'ml', 'machine learning', 'artificial intelligence', 
-                         'data science', 'nlp', 'computer vision', 'deep learning']
+        # One whole-word scan over both fields for any AI/ML keyword
+        if _AI_ML_KEYWORDS_RE.search(title) or _AI_ML_KEYWORDS_RE.search(description):
+            return True
         
-        has_ai_ml = any(keyword in title or keyword in description for keyword in ai_ml_keywords)
-        has_job_role = job_role_lower in title or any(word in title for word in job_role_lower.split())
-        
-        return has_ai_ml or has_job_role
+        title_lower = title.lower()
+        job_role_lower = job_role.lower()
+        return job_role_lower in title_lower or any(word in title_lower for word in job_role_lower.split())
 
 class NaukriJobAPI(JobSearchAPI):
     """Enhanced Naukri.com job search API"""
     
+    salary_patterns = _NAUKRI_SALARY_RES
+    date_patterns = _NAUKRI_DATE_RES
+
     def __init__(self):
         super().__init__("Naukri")
         
@@ -287,6 +985,7 @@ class NaukriJobAPI(JobSearchAPI):
         """Search Naukri jobs"""
         self.emit_status("Starting Naukri job search...")
         jobs = []
+        today = date.today()  # Resolved once per search for every posted_date
         
         try:
             search_queries = [
@@ -300,26 +999,27 @@ class NaukriJobAPI(JobSearchAPI):
                 self.emit_status(f"Searching Naukri - Query {i+1}/2")
                 
                 try:
-                    search = GoogleSearch({
-                        "api_key": SERPAPI_API_KEY,
+                    results = serpapi_search({
                         "engine": "google",
                         "q": query,
                         "num": 10,
                         "gl": "in"
                     })
                     
-                    results = search.get_dict()
-                    
-                    if 'organic_results' in results:
-                        for result in results['organic_results']:
-                            if 'naukri.com' in result.get('link', ''):
-                                job = self._parse_naukri_result(result, location, experience)
-                                if job:
-                                    jobs.append(job)
+                    organic_results = results.get('organic_results')
+                    if not organic_results:
+                        continue
                     
-                    time.sleep(REQUEST_DELAY)
+                    for result in organic_results:
+                        link = result.get('link') or ''
+                        if not link:
+                            continue
+                        if _job_source_of(link) == 'naukri':
+                            job = self._parse_naukri_result(result, location, experience, today)
+                            if job:
+                                jobs.append(job)
                     
-                except Exception as e:
+                except SEARCH_QUERY_ERRORS as e:
                     self.emit_status(f"Query {i+1} failed: {str(e)}", "warning")
                     continue
             
@@ -331,7 +1031,7 @@ class NaukriJobAPI(JobSearchAPI):
             logger.error(f"Naukri search error: {e}")
             return []
     
-    def _parse_naukri_result(self, result: Dict, location: str, experience: str) -> Optional[Dict]:
+    def _parse_naukri_result(self, result: Dict, location: str, experience: str, today: date) -> Optional[Dict]:
         """Parse Naukri search result"""
         try:
             title = result.get('title', '').replace(' - Naukri.com', '').strip()
@@ -350,7 +1050,7 @@ class NaukriJobAPI(JobSearchAPI):
                 'job_type': 'Full-time',
                 'experience_level': f"{experience} years",
                 'salary': self._extract_salary(snippet),
-                'posted_date': self._extract_date(snippet),
+                'posted_date': self._extract_date(snippet, today),
                 'skills': self._extract_skills(title + ' ' + snippet)
             }
             
@@ -363,70 +1063,22 @@ class NaukriJobAPI(JobSearchAPI):
         lines = snippet.split('\n')
         for line in lines:
             line = line.strip()
-            if line and len(line.split()) <= 4 and not any(word in line.lower() for word in ['job', 'hiring', 'experience', 'salary']):
+            if line and len(line.split()) <= 4 and not _NAUKRI_SNIPPET_NOISE_RE.search(line):
                 return line
         
         # Try first line
         if lines:
-            first_line = lines[0].strip()
-            if first_line and len(first_line) < 50:
-                return first_line
-        
-        return "Company Not Specified"
-    
-    def _extract_salary(self, text: str) -> str:
-        """Extract salary information"""
-        salary_patterns = [
-            r'₹\s*[\d,]+\s*-\s*₹?\s*[\d,]+',
-            r'Rs\.?\s*[\d,]+\s*-\s*[\d,]+',
-            r'\d+\s*-\s*\d+\s*LPA',
-            r'\d+\s*LPA',
-            r'\d+\s*lakhs?'
-        ]
-        
-        for pattern in salary_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(0)
-        
-        return "Not Disclosed"
-    
-    def _extract_date(self, text: str) -> str:
-        """Extract posting date"""
-        date_patterns = [
-            r'(\d+)\s+days?\s+ago',
-            r'posted\s+(\d+)\s+days?\s+ago'
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                days_ago = int(match.group(1))
-                date = datetime.now() - timedelta(days=days_ago)
-                return date.strftime('%Y-%m-%d')
-        
-        return datetime.now().strftime('%Y-%m-%d')
-    
-    def _extract_skills(self, text: str) -> List[str]:
-        """Extract skills from text"""
-        skills = []
-        skill_keywords = [
-            'Python', 'Java', 'JavaScript', 'React', 'Node.js', 'Django', 'Flask',
-            'TensorFlow', 'PyTorch', 'Scikit-learn', 'Pandas', 'NumPy',
-            'Machine Learning', 'Deep Learning', 'NLP', 'Computer Vision',
-            'AI', 'Data Science', 'SQL', 'MongoDB', 'AWS', 'Azure'
-        ]
-        
-        text_lower = text.lower()
-        for skill in skill_keywords:
-            if skill.lower() in text_lower:
-                skills.append(skill)
+            first_line = lines[0].strip()
+            if first_line and len(first_line) < 50:
+                return first_line
         
-        return skills[:5]
+        return "Company Not Specified"
 
 class IndeedJobAPI(JobSearchAPI):
     """Enhanced Indeed.in job search API"""
     
+    salary_patterns = _INDEED_SALARY_RES
+
     def __init__(self):
         super().__init__("Indeed")
         
@@ -434,6 +1086,7 @@ class IndeedJobAPI(JobSearchAPI):
         """Search Indeed jobs"""
         self.emit_status("Starting Indeed job search...")
         jobs = []
+        today = date.today()  # Resolved once per search for every posted_date
         
         try:
             search_queries = [
@@ -446,27 +1099,27 @@ class IndeedJobAPI(JobSearchAPI):
                 self.emit_status(f"Searching Indeed - Query {i+1}/2")
                 
                 try:
-                    search = GoogleSearch({
-                        "api_key": SERPAPI_API_KEY,
+                    results = serpapi_search({
                         "engine": "google",
                         "q": query,
                         "num": 8,
                         "gl": "in"
                     })
                     
-                    results = search.get_dict()
-                    
-                    if 'organic_results' in results:
-                        for result in results['organic_results']:
-                            link = result.get('link', '')
-                            if 'indeed.co.in' in link or 'indeed.com' in link:
-                                job = self._parse_indeed_result(result, location)
-                                if job:
-                                    jobs.append(job)
+                    organic_results = results.get('organic_results')
+                    if not organic_results:
+                        continue
                     
-                    time.sleep(REQUEST_DELAY)
+                    for result in organic_results:
+                        link = result.get('link') or ''
+                        if not link:
+                            continue
+                        if _job_source_of(link) == 'indeed':
+                            job = self._parse_indeed_result(result, location, today)
+                            if job:
+                                jobs.append(job)
                     
-                except Exception as e:
+                except SEARCH_QUERY_ERRORS as e:
                     self.emit_status(f"Query {i+1} failed: {str(e)}", "warning")
                     continue
             
@@ -478,7 +1131,7 @@ class IndeedJobAPI(JobSearchAPI):
             logger.error(f"Indeed search error: {e}")
             return []
     
-    def _parse_indeed_result(self, result: Dict, location: str) -> Optional[Dict]:
+    def _parse_indeed_result(self, result: Dict, location: str, today: date) -> Optional[Dict]:
         """Parse Indeed search result"""
         try:
             title = result.get('title', '').replace(' - Indeed', '').strip()
@@ -497,7 +1150,7 @@ class IndeedJobAPI(JobSearchAPI):
                 'job_type': 'Full-time',
                 'experience_level': 'Entry Level',
                 'salary': self._extract_salary(snippet),
-                'posted_date': datetime.now().strftime('%Y-%m-%d'),
+                'posted_date': today.isoformat(),
                 'skills': self._extract_skills(title + ' ' + snippet)
             }
             
@@ -512,33 +1165,6 @@ class IndeedJobAPI(JobSearchAPI):
             if len(parts) > 1:
                 return parts[-1].strip()
         return "Company Not Specified"
-    
-    def _extract_salary(self, text: str) -> str:
-        """Extract salary from text"""
-        salary_patterns = [
-            r'₹\s*[\d,]+\s*-\s*₹?\s*[\d,]+',
-            r'\$\s*[\d,]+\s*-\s*\$?\s*[\d,]+',
-            r'\d+\s*LPA'
-        ]
-        
-        for pattern in salary_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(0)
-        
-        return "Not Disclosed"
-    
-    def _extract_skills(self, text: str) -> List[str]:
-        """Extract skills from text"""
-        skills = []
-        skill_keywords = ['Python', 'Java', 'AI', 'ML', 'TensorFlow', 'PyTorch', 'SQL']
-        
-        text_lower = text.lower()
-        for skill in skill_keywords:
-            if skill.lower() in text_lower:
-                skills.append(skill)
-        
-        return skills
 
 class FreshersWorldAPI(JobSearchAPI):
     """FreshersWorld job search"""
@@ -550,37 +1176,37 @@ class FreshersWorldAPI(JobSearchAPI):
         """Search FreshersWorld jobs"""
         self.emit_status("Starting FreshersWorld job search...")
         jobs = []
+        today = date.today()  # Resolved once per search for every posted_date
         
         try:
             search_query = f"{job_role} AI ML {location} site:freshersworld.com"
             
-            search = GoogleSearch({
-                "api_key": SERPAPI_API_KEY,
+            results = serpapi_search({
                 "engine": "google",
                 "q": search_query,
                 "num": 8,
                 "gl": "in"
             })
             
-            results = search.get_dict()
-            
-            if 'organic_results' in results:
-                for result in results['organic_results']:
-                    if 'freshersworld.com' in result.get('link', ''):
-                        job = {
-                            'title': result.get('title', ''),
-                            'company': 'Various Companies',
-                            'location': location,
-                            'description': result.get('snippet', ''),
-                            'url': result.get('link', ''),
-                            'source': 'FreshersWorld',
-                            'job_type': 'Full-time',
-                            'experience_level': 'Fresher',
-                            'salary': "As per industry standards",
-                            'posted_date': datetime.now().strftime('%Y-%m-%d'),
-                            'skills': ['Python', 'AI', 'ML']
-                        }
-                        jobs.append(job)
+            for result in results.get('organic_results') or []:
+                link = result.get('link') or ''
+                if not link:
+                    continue
+                if _job_source_of(link) == 'freshersworld':
+                    job = {
+                        'title': result.get('title', ''),
+                        'company': 'Various Companies',
+                        'location': location,
+                        'description': result.get('snippet', ''),
+                        'url': link,
+                        'source': 'FreshersWorld',
+                        'job_type': 'Full-time',
+                        'experience_level': 'Fresher',
+                        'salary': "As per industry standards",
+                        'posted_date': today.isoformat(),
+                        'skills': ['Python', 'AI', 'ML']
+                    }
+                    jobs.append(job)
             
             self.emit_status(f"FreshersWorld search completed - {len(jobs)} jobs found")
             return jobs[:8]
@@ -600,37 +1226,37 @@ class MonsterJobAPI(JobSearchAPI):
         """Search Monster jobs"""
         self.emit_status("Starting Monster job search...")
         jobs = []
+        today = date.today()  # Resolved once per search for every posted_date
         
         try:
             search_query = f"{job_role} AI ML entry level {location} site:monster.co.in"
             
-            search = GoogleSearch({
-                "api_key": SERPAPI_API_KEY,
+            results = serpapi_search({
                 "engine": "google",
                 "q": search_query,
                 "num": 8,
                 "gl": "in"
             })
             
-            results = search.get_dict()
-            
-            if 'organic_results' in results:
-                for result in results['organic_results']:
-                    if 'monster.co.in' in result.get('link', ''):
-                        job = {
-                            'title': result.get('title', ''),
-                            'company': self._extract_company(result.get('snippet', '')),
-                            'location': location,
-                            'description': result.get('snippet', ''),
-                            'url': result.get('link', ''),
-                            'source': 'Monster',
-                            'job_type': 'Full-time',
-                            'experience_level': 'Entry Level',
-                            'salary': "Competitive",
-                            'posted_date': datetime.now().strftime('%Y-%m-%d'),
-                            'skills': ['Python', 'AI', 'ML']
-                        }
-                        jobs.append(job)
+            for result in results.get('organic_results') or []:
+                link = result.get('link') or ''
+                if not link:
+                    continue
+                if _job_source_of(link) == 'monster':
+                    job = {
+                        'title': result.get('title', ''),
+                        'company': self._extract_company(result.get('snippet', '')),
+                        'location': location,
+                        'description': result.get('snippet', ''),
+                        'url': link,
+                        'source': 'Monster',
+                        'job_type': 'Full-time',
+                        'experience_level': 'Entry Level',
+                        'salary': "Competitive",
+                        'posted_date': today.isoformat(),
+                        'skills': ['Python', 'AI', 'ML']
+                    }
+                    jobs.append(job)
             
             self.emit_status(f"Monster search completed - {len(jobs)} jobs found")
             return jobs[:8]
@@ -647,16 +1273,238 @@ class MonsterJobAPI(JobSearchAPI):
 
 # Interview Question Search Engine
 
+# HTML parsing - lxml's C parser is several times faster than the pure-Python html.parser
+_HTML_PARSER = 'lxml' if importlib.util.find_spec('lxml') else 'html.parser'
+
+# Elements scanned for question text by _scrape_page_for_questions
+_HEADING_TAGS = frozenset(['h1', 'h2', 'h3', 'h4'])
+_CODE_TAGS = frozenset(['pre', 'code'])
+_QUESTION_ELEMENT_TAGS = ['li', 'div', 'p', 'h1', 'h2', 'h3', 'h4', 'pre', 'code']
+
+def parse_html(markup, encoding: Optional[str] = None) -> BeautifulSoup:
+    """Parse scraped HTML with the fastest available backend, dropping script/style content
+
+    Raw bytes are handed straight to the parser; a charset declared in the HTTP headers
+    skips encoding detection, otherwise the page's <meta> charset is used.
+    """
+    soup = BeautifulSoup(markup, _HTML_PARSER, from_encoding=encoding)
+    for element in soup(["script", "style"]):
+        element.decompose()
+    return soup
+
+# Search spellings of frequently-asked-about companies
+_COMPANY_VARIATIONS: Mapping[str, List[str]] = MappingProxyType({
+    'google': ['Google', 'Google India', 'Alphabet'],
+    'microsoft': ['Microsoft', 'Microsoft India', 'MSFT'],
+    'amazon': ['Amazon', 'Amazon India', 'AWS'],
+    'meta': ['Meta', 'Facebook', 'FB', 'Meta India'],
+    'apple': ['Apple', 'Apple India'],
+    'netflix': ['Netflix', 'Netflix India'],
+    'uber': ['Uber', 'Uber India', 'Uber Technologies'],
+    'airbnb': ['Airbnb', 'Airbnb India'],
+    'linkedin': ['LinkedIn', 'LinkedIn India'],
+    'twitter': ['Twitter', 'X Corp'],
+    'salesforce': ['Salesforce', 'Salesforce India'],
+    'oracle': ['Oracle', 'Oracle India', 'Oracle Corporation'],
+    'adobe': ['Adobe', 'Adobe India', 'Adobe Systems'],
+    'intel': ['Intel', 'Intel India', 'Intel Corporation'],
+    'nvidia': ['NVIDIA', 'Nvidia India'],
+    'qualcomm': ['Qualcomm', 'Qualcomm India'],
+    'ibm': ['IBM', 'IBM India', 'International Business Machines'],
+    'cisco': ['Cisco', 'Cisco Systems', 'Cisco India'],
+    'vmware': ['VMware', 'VMWare India'],
+    'servicenow': ['ServiceNow', 'ServiceNow India'],
+    'snowflake': ['Snowflake', 'Snowflake Computing'],
+    'databricks': ['Databricks'],
+    'palantir': ['Palantir', 'Palantir Technologies'],
+    'stripe': ['Stripe', 'Stripe India'],
+    'shopify': ['Shopify'],
+    'zoom': ['Zoom', 'Zoom Video Communications'],
+    'slack': ['Slack', 'Slack Technologies'],
+    'atlassian': ['Atlassian'],
+    'gitlab': ['GitLab'],
+    'github': ['GitHub'],
+    'docker': ['Docker', 'Docker Inc'],
+    'kubernetes': ['Kubernetes'],
+    'tcs': ['TCS', 'Tata Consultancy Services', 'TATA'],
+    'infosys': ['Infosys', 'Infosys Limited'],
+    'wipro': ['Wipro', 'Wipro Limited', 'Wipro Technologies'],
+    'hcl': ['HCL', 'HCL Technologies', 'HCLTech'],
+    'accenture': ['Accenture', 'Accenture India'],
+    'cognizant': ['Cognizant', 'CTS', 'Cognizant Technology Solutions'],
+    'capgemini': ['Capgemini', 'Cap Gemini India'],
+    'deloitte': ['Deloitte', 'Deloitte India'],
+    'pwc': ['PwC', 'PricewaterhouseCoopers'],
+    'ey': ['EY', 'Ernst & Young'],
+    'kpmg': ['KPMG', 'KPMG India'],
+    'flipkart': ['Flipkart', 'Flipkart India'],
+    'paytm': ['Paytm', 'PayTM', 'One97 Communications'],
+    'ola': ['Ola', 'Ola Cabs', 'Ola Electric'],
+    'zomato': ['Zomato', 'Zomato India'],
+    'swiggy': ['Swiggy'],
+    'byju': ['BYJU\'S', 'Byjus', 'Think and Learn'],
+    'unacademy': ['Unacademy'],
+    'phonepe': ['PhonePe', 'Phone Pe'],
+    'razorpay': ['Razorpay'],
+    'freshworks': ['Freshworks', 'Freshdesk'],
+    'zoho': ['Zoho', 'Zoho Corporation'],
+    'mindtree': ['Mindtree', 'LTI Mindtree']
+})
+
+@lru_cache(maxsize=EXTRACTOR_CACHE_SIZE)
+def _company_variations(company: str) -> Tuple[str, ...]:
+    """Search spellings of a company name"""
+    company_lower = company.lower()
+    for key, variations in _COMPANY_VARIATIONS.items():
+        if key in company_lower or company_lower in key:
+            return tuple(variations)
+
+    # If not found in map, return basic variations
+    return (company, company.upper(), company.title(), f"{company} India")
+
+# Memoized question helpers - every question from one page shares the same URL and
+# title, and the same snippets come back across query variants
+
+# Source type and credibility score by site, matched on the link's host or a parent domain
+_SOURCE_CREDIBILITY = {
+    'leetcode.com': ("coding_platform", 9),
+    'interviewbit.com': ("coding_platform", 9),
+    'geeksforgeeks.org': ("coding_platform", 9),
+    'glassdoor.co.in': ("job_review", 8),
+    'glassdoor.com': ("job_review", 8),
+    'ambitionbox.com': ("job_review", 8),
+    'github.com': ("developer_community", 7),
+    'stackoverflow.com': ("developer_community", 7),
+    'medium.com': ("tech_blog", 6),
+    'dev.to': ("tech_blog", 6),
+    'hackernoon.com': ("tech_blog", 6),
+    'careercup.com': ("interview_prep", 8),
+    'pramp.com': ("interview_prep", 8),
+}
+
+# Sites whose pages may be fetched while searching for questions (and their subdomains)
+_SAFE_SCRAPE_HOSTS = frozenset([
+    'leetcode.com', 'interviewbit.com', 'geeksforgeeks.org',
+    'glassdoor.co.in', 'glassdoor.com', 'ambitionbox.com',
+    'careercup.com', 'github.com', 'stackoverflow.com',
+    'medium.com', 'dev.to', 'hackernoon.com'
+])
+
+@lru_cache(maxsize=EXTRACTOR_CACHE_SIZE)
+def _source_credibility(host: str, title: str) -> Tuple[str, int]:
+    """Source type and credibility score for a page host and title"""
+    title_lower = title.lower()
+
+    known_source = _match_host_suffix(host, _SOURCE_CREDIBILITY) if host else None
+    if known_source:
+        source_type, credibility_score = known_source
+    elif any(phrase in title_lower for phrase in ['interview experience', 'asked in interview', 'interview questions']):
+        source_type, credibility_score = "interview_experience", 3
+    else:
+        source_type, credibility_score = "unknown", 0
+
+    # Boost score for recent content
+    if any(year in title_lower for year in ['2024', '2023', '2022']):
+        credibility_score += 1
+
+    return source_type, credibility_score
+
+# Domain-specific difficulty indicators
+_DIFFICULTY_INDICATORS = {
+    'easy': KeywordSet([
+        'what is', 'define', 'explain', 'basic', 'introduction',
+        'difference between', 'types of', 'advantages', 'disadvantages',
+        'simple', 'basic concept', 'fundamental'
+    ]),
+    'medium': KeywordSet([
+        'implement', 'design', 'algorithm', 'optimize', 'efficient',
+        'time complexity', 'space complexity', 'approach', 'solution',
+        'strategy', 'method'
+    ]),
+    'hard': KeywordSet([
+        'advanced', 'complex', 'distributed', 'scalable', 'architecture',
+        'system design', 'optimization', 'performance', 'large scale',
+        'trade-offs', 'design patterns', 'microservices'
+    ])
+}
+_CODING_HINTS = KeywordSet(['implement', 'algorithm', 'code'])
+
+@lru_cache(maxsize=EXTRACTOR_CACHE_SIZE)
+def _question_difficulty(question_text: str) -> str:
+    """Easy/Medium/Hard rating of a question from its wording and length"""
+    question_lower = question_text.lower()
+
+    if len(question_text) > 200 or _DIFFICULTY_INDICATORS['hard'].search(question_lower):
+        return "Hard"
+    elif (_CODING_HINTS.search(question_lower) or
+          _DIFFICULTY_INDICATORS['medium'].count(question_lower) > _DIFFICULTY_INDICATORS['easy'].count(question_lower)):
+        return "Medium"
+    else:
+        return "Easy"
+
+# Question categories, checked in order - the first one with a keyword in the question wins
+_QUESTION_TYPE_KEYWORDS = (
+    ("Coding", KeywordSet(['implement', 'write', 'code', 'program', 'function'])),
+    ("System Design", KeywordSet(['design', 'architecture', 'system', 'scalable'])),
+    ("Conceptual", KeywordSet(['what is', 'define', 'explain', 'describe'])),
+    ("Comparison", KeywordSet(['difference', 'compare', 'vs', 'versus'])),
+    ("Optimization", KeywordSet(['optimize', 'improve', 'efficient', 'better'])),
+)
+
+@lru_cache(maxsize=EXTRACTOR_CACHE_SIZE)
+def _question_type(question_text: str) -> str:
+    """Coding/System Design/Conceptual/... category of a question"""
+    question_lower = question_text.lower()
+
+    for question_type, keywords in _QUESTION_TYPE_KEYWORDS:
+        if keywords.search(question_lower):
+            return question_type
+    return "General"
+
+# Relevance bonuses for question type and difficulty
+_QUESTION_TYPE_BONUS = {'Coding': 2, 'System Design': 2}
+_DIFFICULTY_BONUS = {'Medium': 2, 'Hard': 1}
+
+# A question must contain one of these and none of the page-chrome phrases
+_QUESTION_INDICATORS = KeywordSet([
+    'what', 'how', 'why', 'when', 'where', 'which', 'who', 'whose',
+    'can', 'could', 'would', 'should', 'will', 'do', 'does', 'did',
+    'is', 'are', 'was', 'were', 'has', 'have', 'had',
+    'explain', 'describe', 'define', 'list', 'name', 'tell',
+    'write', 'implement', 'design', 'create', 'build', 'solve',
+    'find', 'calculate', 'compare', 'analyze', 'discuss', 'evaluate'
+])
+_NON_QUESTION_PHRASES = KeywordSet([
+    'click here', 'read more', 'see also', 'related articles',
+    'advertisement', 'subscribe', 'follow us', 'share this',
+    'comments', 'reply', 'like this', 'vote up'
+])
 
 class InterviewQuestionAPI:
     """Dynamic Interview Question Search API for recent company-specific questions"""
     
+    # Question extraction patterns, compiled once when the module loads
+    question_patterns: Tuple[re.Pattern, ...] = _QUESTION_RES
+    # The same patterns, each paired with its literal prefilter
+    question_matchers: Tuple[Tuple[Tuple[str, ...], re.Pattern], ...] = _QUESTION_MATCHERS
+
+    # Search keywords per interview domain, built once instead of on every query generation
+    domain_terms: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+        'DSA': ('data structures', 'algorithms', 'coding', 'programming'),
+        'SQL': ('sql', 'database', 'mysql', 'postgresql', 'queries'),
+        'OS': ('operating system', 'os', 'processes', 'threads', 'memory management'),
+        'CN': ('computer networks', 'networking', 'tcp', 'ip', 'http'),
+        'DBMS': ('database management', 'dbms', 'sql', 'normalization', 'transactions'),
+        'Machine Learning': ('machine learning', 'ml', 'ai', 'algorithms', 'models'),
+        'Deep Learning': ('deep learning', 'neural networks', 'tensorflow', 'pytorch'),
+        'Python': ('python', 'programming', 'coding', 'scripting'),
+        'Java': ('java', 'programming', 'coding', 'oop'),
+        'System Design': ('system design', 'architecture', 'scalability', 'distributed systems')
+    })
+
     def __init__(self):
         self.source_name = "Interview Questions"
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        self.session = http_session
         
         # High-quality sources for interview questions
         self.interview_sources = [
@@ -677,44 +1525,14 @@ class InterviewQuestionAPI:
         # Recent years to focus search
         self.recent_years = [2024, 2023, 2022]
         
-        # Question extraction patterns
-        self.question_patterns = [
-            # Direct question formats
-            r'Q\d*[.:\s]*(.+\?)',
-            r'Question\s*\d*[.:\s]*(.+\?)',
-            r'(\d+\.\s*.+\?)',
-            
-            # Interview experience patterns
-            r'(?:asked|question was|interviewer asked)[:\s]*(.+\?)',
-            r'(?:They asked|He asked|She asked)[:\s]*(.+\?)',
-            
-            # Leetcode/Coding platform patterns
-            r'Problem[:\s]*(.+\?)',
-            r'Challenge[:\s]*(.+\?)',
-            
-            # Technical question patterns
-            r'((?:What|How|Why|When|Where|Which|Can|Do|Does|Is|Are|Will|Would|Should|Could|Have|Has|Did|Explain|Describe|Define|List|Name|Tell|Write|Find|Calculate|Solve|Compare|Analyze|Discuss|Evaluate|Implement|Design|Create)\s+[^?.!]+\?)',
-            
-            # Code-related questions
-            r'(Write\s+(?:a\s+)?(?:function|code|program|algorithm|method)\s+(?:to|for|that)\s+[^?.!]+\?)',
-            r'(Implement\s+[^?.!]+\?)',
-            r'(Design\s+[^?.!]+\?)',
-            
-            # System design patterns
-            r'(How\s+would\s+you\s+(?:design|build|implement|create)\s+[^?.!]+\?)',
-        ]
-        
     def emit_status(self, message: str, status: str = "info"):
         """Emit status to frontend"""
-        try:
-            socketio.emit('thought', {
-                'agent': 'Interview Agent',
-                'message': message,
-                'status': status,
-                'timestamp': datetime.now().isoformat()
-            })
-        except Exception as e:
-            logger.error(f"Failed to emit status: {e}")
+        queue_thought({
+            'agent': 'Interview Agent',
+            'message': message,
+            'status': status,
+            'timestamp': now_iso()
+        })
     
     def search_interview_questions(self, domain: str, company: str = None, difficulty: str = "all", question_count: int = 10) -> List[Dict]:
         """Search for real, recent interview questions from specific companies, limited to question_count"""
@@ -726,26 +1544,33 @@ class InterviewQuestionAPI:
             # Generate targeted search queries
             search_queries = self._generate_dynamic_search_queries(domain, company, difficulty)
             
-            for i, query in enumerate(search_queries[:5]):  # Limit to 8 queries
-                if len(all_questions) >= question_count:  # Stop if we have enough questions
-                    break
-                    
-                self.emit_status(f"🔍 Searching query {i+1}/8: {query[:60]}...")
-                
-                try:
-                    search = GoogleSearch({
-                        "api_key": SERPAPI_API_KEY,
-                        "engine": "google",
-                        "q": query,
-                        "num": min(12, question_count - len(all_questions)),  # Fetch only needed results
-                        "gl": "in",
-                        "hl": "en"
-                    })
-                    
-                    results = search.get_dict()
+            # Result pages are fetched concurrently; SerpAPI calls stay throttled by serpapi_limiter
+            with ThreadPoolExecutor(max_workers=SCRAPE_WORKERS) as executor:
+                for i, query in enumerate(search_queries[:5]):  # Limit to 8 queries
+                    if len(all_questions) >= question_count:  # Stop if we have enough questions
+                        break
+
+                    self.emit_status(f"🔍 Searching query {i+1}/8: {query[:60]}...")
                     
-                    if 'organic_results' in results:
-                        for result in results['organic_results']:
+                    try:
+                        results = serpapi_search({
+                            "engine": "google",
+                            "q": query,
+                            "num": min(12, question_count - len(all_questions)),  # Fetch only needed results
+                            "gl": "in",
+                            "hl": "en"
+                        })
+
+                        organic_results = results.get('organic_results') or []
+                        needed = question_count - len(all_questions)
+
+                        # Scrape every result page at once, consuming them in result order
+                        page_futures = [
+                            executor.submit(self._scrape_page_for_questions, result.get('link', ''), domain, company, needed)
+                            for result in organic_results
+                        ]
+
+                        for result, page_future in zip(organic_results, page_futures):
                             if len(all_questions) >= question_count:  # Stop if we have enough questions
                                 break
                                 
@@ -753,17 +1578,17 @@ class InterviewQuestionAPI:
                             questions = self._extract_questions_from_result(result, domain, company)
                             all_questions.extend(questions[:question_count - len(all_questions)])  # Limit extracted questions
                             
-                            # Scrape the actual page for more questions
-                            page_questions = self._scrape_page_for_questions(
-                                result.get('link', ''), domain, company
-                            )
+                            # Questions scraped from the actual page
+                            page_questions = page_future.result()
                             all_questions.extend(page_questions[:question_count - len(all_questions)])  # Limit scraped questions
-                    
-                    time.sleep(REQUEST_DELAY)  # Rate limiting
-                    
-                except Exception as e:
-                    self.emit_status(f"❌ Query {i+1} failed: {str(e)}", "warning")
-                    continue
+
+                        # Pages we no longer need are dropped if they haven't started yet
+                        for page_future in page_futures:
+                            page_future.cancel()
+
+                    except Exception as e:
+                        self.emit_status(f"❌ Query {i+1} failed: {str(e)}", "warning")
+                        continue
             
             # Remove duplicates and filter by relevance
             unique_questions = self._remove_duplicate_questions(all_questions)
@@ -791,20 +1616,7 @@ class InterviewQuestionAPI:
         current_year = datetime.now().year
         
         # Base query components
-        domain_terms = {
-            'DSA': ['data structures', 'algorithms', 'coding', 'programming'],
-            'SQL': ['sql', 'database', 'mysql', 'postgresql', 'queries'],
-            'OS': ['operating system', 'os', 'processes', 'threads', 'memory management'],
-            'CN': ['computer networks', 'networking', 'tcp', 'ip', 'http'],
-            'DBMS': ['database management', 'dbms', 'sql', 'normalization', 'transactions'],
-            'Machine Learning': ['machine learning', 'ml', 'ai', 'algorithms', 'models'],
-            'Deep Learning': ['deep learning', 'neural networks', 'tensorflow', 'pytorch'],
-            'Python': ['python', 'programming', 'coding', 'scripting'],
-            'Java': ['java', 'programming', 'coding', 'oop'],
-            'System Design': ['system design', 'architecture', 'scalability', 'distributed systems']
-        }
-        
-        domain_keywords = domain_terms.get(domain, [domain.lower()])
+        domain_keywords = self.domain_terms.get(domain, (domain.lower(),))
         
         # Company-specific queries
         if company:
@@ -839,75 +1651,17 @@ class InterviewQuestionAPI:
             for keyword in domain_keywords[:1]:  # One keyword per source
                 queries.append(f'{keyword} interview questions {source} {current_year}')
         
-        return queries[:15]  # Limit total queries
+        # Drop repeats that differ only in case or spacing - the search API treats them
+        # as one query, so each would cost a round-trip and a scrape fan-out for nothing
+        unique_queries = {}
+        for query in queries:
+            unique_queries.setdefault(_WHITESPACE_RE.sub(' ', query).strip().casefold(), query)
+
+        return list(unique_queries.values())[:15]  # Limit total queries
     
     def _get_company_variations(self, company: str) -> List[str]:
         """Get variations of company names for better search"""
-        company_map = {
-            'google': ['Google', 'Google India', 'Alphabet'],
-            'microsoft': ['Microsoft', 'Microsoft India', 'MSFT'],
-            'amazon': ['Amazon', 'Amazon India', 'AWS'],
-            'meta': ['Meta', 'Facebook', 'FB', 'Meta India'],
-            'apple': ['Apple', 'Apple India'],
-            'netflix': ['Netflix', 'Netflix India'],
-            'uber': ['Uber', 'Uber India', 'Uber Technologies'],
-            'airbnb': ['Airbnb', 'Airbnb India'],
-            'linkedin': ['LinkedIn', 'LinkedIn India'],
-            'twitter': ['Twitter', 'X Corp'],
-            'salesforce': ['Salesforce', 'Salesforce India'],
-            'oracle': ['Oracle', 'Oracle India', 'Oracle Corporation'],
-            'adobe': ['Adobe', 'Adobe India', 'Adobe Systems'],
-            'intel': ['Intel', 'Intel India', 'Intel Corporation'],
-            'nvidia': ['NVIDIA', 'Nvidia India'],
-            'qualcomm': ['Qualcomm', 'Qualcomm India'],
-            'ibm': ['IBM', 'IBM India', 'International Business Machines'],
-            'cisco': ['Cisco', 'Cisco Systems', 'Cisco India'],
-            'vmware': ['VMware', 'VMWare India'],
-            'servicenow': ['ServiceNow', 'ServiceNow India'],
-            'snowflake': ['Snowflake', 'Snowflake Computing'],
-            'databricks': ['Databricks'],
-            'palantir': ['Palantir', 'Palantir Technologies'],
-            'stripe': ['Stripe', 'Stripe India'],
-            'shopify': ['Shopify'],
-            'zoom': ['Zoom', 'Zoom Video Communications'],
-            'slack': ['Slack', 'Slack Technologies'],
-            'atlassian': ['Atlassian'],
-            'gitlab': ['GitLab'],
-            'github': ['GitHub'],
-            'docker': ['Docker', 'Docker Inc'],
-            'kubernetes': ['Kubernetes'],
-            'tcs': ['TCS', 'Tata Consultancy Services', 'TATA'],
-            'infosys': ['Infosys', 'Infosys Limited'],
-            'wipro': ['Wipro', 'Wipro Limited', 'Wipro Technologies'],
-            'hcl': ['HCL', 'HCL Technologies', 'HCLTech'],
-            'accenture': ['Accenture', 'Accenture India'],
-            'cognizant': ['Cognizant', 'CTS', 'Cognizant Technology Solutions'],
-            'capgemini': ['Capgemini', 'Cap Gemini India'],
-            'deloitte': ['Deloitte', 'Deloitte India'],
-            'pwc': ['PwC', 'PricewaterhouseCoopers'],
-            'ey': ['EY', 'Ernst & Young'],
-            'kpmg': ['KPMG', 'KPMG India'],
-            'flipkart': ['Flipkart', 'Flipkart India'],
-            'paytm': ['Paytm', 'PayTM', 'One97 Communications'],
-            'ola': ['Ola', 'Ola Cabs', 'Ola Electric'],
-            'zomato': ['Zomato', 'Zomato India'],
-            'swiggy': ['Swiggy'],
-            'byju': ['BYJU\'S', 'Byjus', 'Think and Learn'],
-            'unacademy': ['Unacademy'],
-            'phonepe': ['PhonePe', 'Phone Pe'],
-            'razorpay': ['Razorpay'],
-            'freshworks': ['Freshworks', 'Freshdesk'],
-            'zoho': ['Zoho', 'Zoho Corporation'],
-            'mindtree': ['Mindtree', 'LTI Mindtree']
-        }
-        
-        company_lower = company.lower()
-        for key, variations in company_map.items():
-            if key in company_lower or company_lower in key:
-                return variations
-        
-        # If not found in map, return basic variations
-        return [company, company.upper(), company.title(), f"{company} India"]
+        return list(_company_variations(company))
     
     def _extract_questions_from_result(self, result: Dict, domain: str, company: str = None) -> List[Dict]:
         """Extract questions from search result snippet and title"""
@@ -922,133 +1676,175 @@ class InterviewQuestionAPI:
             text = f"{title} {snippet}"
             
             # Extract questions using patterns
-            extracted_questions = self._extract_questions_from_text(text)
+            extracted_questions = self._filter_valid_questions(self._extract_questions_from_text(text))
+            if not extracted_questions:
+                return questions
+
+            # Source, company and year come from the same result text, so they are
+            # worked out once and shared by every question it contains
+            source_info = self._analyze_source_credibility(url, title)
+            result_company = company or self._extract_company_from_text(text)
+            result_year = self._extract_year_from_text(text)
             
             for question_text in extracted_questions:
-                if self._is_valid_interview_question(question_text):
-                    # Determine the source and credibility
-                    source_info = self._analyze_source_credibility(url, title)
-                    
-                    question = {
-                        'question': question_text.strip(),
-                        'domain': domain,
-                        'company': company or self._extract_company_from_text(text),
-                        'difficulty': self._determine_question_difficulty(question_text, domain),
-                        'source_url': url,
-                        'source_title': title,
-                        'source_type': source_info['type'],
-                        'credibility_score': source_info['score'],
-                        'year': self._extract_year_from_text(text),
-                        'question_type': self._classify_question_type(question_text, domain),
-                        'solution': ""  # Will be filled by AI enhancement
-                    }
-                    questions.append(question)
-                    
+                question = {
+                    'question': question_text.strip(),
+                    'domain': domain,
+                    'company': result_company,
+                    'difficulty': self._determine_question_difficulty(question_text, domain),
+                    'source_url': url,
+                    'source_title': title,
+                    'source_type': source_info['type'],
+                    'credibility_score': source_info['score'],
+                    'year': result_year,
+                    'question_type': self._classify_question_type(question_text, domain),
+                    'solution': ""  # Will be filled by AI enhancement
+                }
+                questions.append(question)
+
         except Exception as e:
             logger.error(f"Error extracting questions from result: {e}")
         
         return questions
     
-    def _scrape_page_for_questions(self, url: str, domain: str, company: str = None) -> List[Dict]:
-        """Scrape the actual page content for interview questions"""
+    def _fetch_page(self, url: str) -> Tuple[bytes, Optional[str]]:
+        """Download at most MAX_HTML_BYTES of a page, streaming so the rest is never transferred
+
+        Returns the raw body together with the charset declared in Content-Type, if any.
+        """
+        with self.session.get(url, timeout=15, allow_redirects=True, stream=True) as response:
+            response.raise_for_status()
+            content_type = response.headers.get('Content-Type', '')
+            encoding = (requests.utils.get_encoding_from_headers(response.headers)
+                        if 'charset' in content_type.lower() else None)
+
+            chunks = []
+            size = 0
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                chunks.append(chunk)
+                size += len(chunk)
+                if size >= MAX_HTML_BYTES:
+                    break
+
+        return b''.join(chunks)[:MAX_HTML_BYTES], encoding
+
+    def _scrape_page_for_questions(self, url: str, domain: str, company: str = None, needed: int = 15) -> List[Dict]:
+        """Scrape the actual page content for interview questions, stopping once needed are found"""
         questions = []
+        limit = min(needed, 15)  # Limit questions per page
         
-        if not url or not self._is_safe_url(url):
+        if not url or limit <= 0 or not self._is_safe_url(url):
             return questions
         
         try:
-            response = self.session.get(url, timeout=15, allow_redirects=True)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
-            
-            # Extract text content
-            text_content = soup.get_text()
-            
-            # Look for structured question content
-            question_elements = []
-            
-            # Method 1: Look for list items that might contain questions
-            list_items = soup.find_all(['li', 'div', 'p'], text=re.compile(r'\?'))
-            question_elements.extend(list_items)
-            
-            # Method 2: Look for headings that might be questions
-            headings = soup.find_all(['h1', 'h2', 'h3', 'h4'], text=re.compile(r'\?'))
-            question_elements.extend(headings)
+            soup = parse_html(*self._fetch_page(url))
+            current_year = datetime.now().year  # Fallback year for undated questions
+
+            # Every question on the page shares its title and source credibility
+            page_title = soup.title.string if soup.title else ''
+            source_info = self._analyze_source_credibility(url, page_title)
+
+            # Look for structured question content - one walk over the tree, bucketed
+            # so elements keep the order the three methods below produce
+            list_items, headings, code_parents = [], [], []
+
+            for element in soup.find_all(_QUESTION_ELEMENT_TAGS):
+                if element.name in _CODE_TAGS:
+                    # Method 3: Look for code blocks or pre tags (common in coding questions)
+                    parent = element.find_parent()
+                    if parent and '?' in parent.get_text():
+                        code_parents.append(parent)
+                    continue
+
+                # Only elements whose sole text child asks something
+                string = element.string
+                if string is None or '?' not in string:
+                    continue
+                if element.name in _HEADING_TAGS:
+                    # Method 2: Look for headings that might be questions
+                    headings.append(element)
+                else:
+                    # Method 1: Look for list items that might contain questions
+                    list_items.append(element)
             
-            # Method 3: Look for code blocks or pre tags (common in coding questions)
-            code_blocks = soup.find_all(['pre', 'code'])
-            for block in code_blocks:
-                parent = block.find_parent()
-                if parent and '?' in parent.get_text():
-                    question_elements.append(parent)
+            question_elements = list_items + headings + code_parents
             
             # Extract questions from elements
             for element in question_elements:
                 element_text = element.get_text(strip=True)
-                extracted = self._extract_questions_from_text(element_text)
+                extracted = self._filter_valid_questions(self._extract_questions_from_text(element_text))
+                if not extracted:
+                    continue
+
+                element_company = company or self._extract_company_from_text(element_text)
+                element_year = self._extract_year_from_text(element_text) or current_year
                 
                 for question_text in extracted:
-                    if self._is_valid_interview_question(question_text):
-                        source_info = self._analyze_source_credibility(url, soup.title.string if soup.title else '')
-                        
-                        question = {
-                            'question': question_text.strip(),
-                            'domain': domain,
-                            'company': company or self._extract_company_from_text(element_text),
-                            'difficulty': self._determine_question_difficulty(question_text, domain),
-                            'source_url': url,
-                            'source_title': soup.title.string if soup.title else '',
-                            'source_type': source_info['type'],
-                            'credibility_score': source_info['score'],
-                            'year': self._extract_year_from_text(element_text) or datetime.now().year,
-                            'question_type': self._classify_question_type(question_text, domain),
-                            'solution': ""
-                        }
-                        questions.append(question)
+                    question = {
+                        'question': question_text.strip(),
+                        'domain': domain,
+                        'company': element_company,
+                        'difficulty': self._determine_question_difficulty(question_text, domain),
+                        'source_url': url,
+                        'source_title': page_title,
+                        'source_type': source_info['type'],
+                        'credibility_score': source_info['score'],
+                        'year': element_year,
+                        'question_type': self._classify_question_type(question_text, domain),
+                        'solution': ""
+                    }
+                    questions.append(question)
+
+                if len(questions) >= limit:
+                    return questions[:limit]
             
             # Method 4: Extract from full text content as fallback
             if len(questions) < 3:  # If we didn't find many questions
+                # The whole-page text is only materialized when the structured pass came up short
+                text_content = soup.get_text()
+                page_year = self._extract_year_from_text(text_content) or current_year
+
                 text_questions = self._extract_questions_from_text(text_content)
-                for question_text in text_questions[:10]:  # Limit fallback questions
-                    if self._is_valid_interview_question(question_text):
-                        source_info = self._analyze_source_credibility(url, soup.title.string if soup.title else '')
-                        
-                        question = {
-                            'question': question_text.strip(),
-                            'domain': domain,
-                            'company': company or self._extract_company_from_text(question_text),
-                            'difficulty': self._determine_question_difficulty(question_text, domain),
-                            'source_url': url,
-                            'source_title': soup.title.string if soup.title else '',
-                            'source_type': source_info['type'],
-                            'credibility_score': source_info['score'],
-                            'year': self._extract_year_from_text(text_content) or datetime.now().year,
-                            'question_type': self._classify_question_type(question_text, domain),
-                            'solution': ""
-                        }
-                        questions.append(question)
+                for question_text in self._filter_valid_questions(text_questions[:10]):  # Limit fallback questions
+                    question = {
+                        'question': question_text.strip(),
+                        'domain': domain,
+                        'company': company or self._extract_company_from_text(question_text),
+                        'difficulty': self._determine_question_difficulty(question_text, domain),
+                        'source_url': url,
+                        'source_title': page_title,
+                        'source_type': source_info['type'],
+                        'credibility_score': source_info['score'],
+                        'year': page_year,
+                        'question_type': self._classify_question_type(question_text, domain),
+                        'solution': ""
+                    }
+                    questions.append(question)
             
         except Exception as e:
             logger.error(f"Error scraping page {url}: {e}")
         
-        return questions[:15]  # Limit questions per page
+        return questions[:limit]
     
     def _extract_questions_from_text(self, text: str) -> List[str]:
         """Extract interview questions from text using multiple patterns"""
         questions = set()  # Use set to avoid immediate duplicates
-        
+
+        # Every question pattern requires a literal '?', so one C-level scan
+        # lets us skip cleaning and the whole pattern set for text without one
+        if '?' not in text:
+            return []
+
         # Clean text
-        text = re.sub(r'\s+', ' ', text)
-        text = re.sub(r'[^\w\s\?\.\!\-\(\),;:]', ' ', text)
-        
-        # Apply all question patterns
-        for pattern in self.question_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE | re.MULTILINE)
+        text = _WHITESPACE_RE.sub(' ', text)
+        text = _QUESTION_NOISE_RE.sub(' ', text)
+
+        # Apply every question pattern whose required literal occurs in the text
+        folded = text.casefold()
+        for guards, pattern in self.question_matchers:
+            if guards and not any(guard in folded for guard in guards):
+                continue
+            matches = pattern.findall(text)
             for match in matches:
                 if isinstance(match, tuple):
                     question = match[0] if match[0] else (match[1] if len(match) > 1 else '')
@@ -1058,7 +1854,7 @@ class InterviewQuestionAPI:
                 question = question.strip()
                 if question and len(question) > 10:
                     # Clean up the question
-                    question = re.sub(r'\s+', ' ', question)
+                    question = _WHITESPACE_RE.sub(' ', question)
                     question = question.strip(' .,;:')
                     
                     if not question.endswith('?'):
@@ -1079,130 +1875,34 @@ class InterviewQuestionAPI:
         if not text.endswith('?'):
             return False
         
-        # Should contain question indicators
-        question_indicators = [
-            'what', 'how', 'why', 'when', 'where', 'which', 'who', 'whose',
-            'can', 'could', 'would', 'should', 'will', 'do', 'does', 'did',
-            'is', 'are', 'was', 'were', 'has', 'have', 'had',
-            'explain', 'describe', 'define', 'list', 'name', 'tell',
-            'write', 'implement', 'design', 'create', 'build', 'solve',
-            'find', 'calculate', 'compare', 'analyze', 'discuss', 'evaluate'
-        ]
-        
-        has_question_word = any(word in text_lower for word in question_indicators)
-        
-        # Exclude non-question content
-        exclude_phrases = [
-            'click here', 'read more', 'see also', 'related articles',
-            'advertisement', 'subscribe', 'follow us', 'share this',
-            'comments', 'reply', 'like this', 'vote up'
-        ]
-        
-        has_excluded = any(phrase in text_lower for phrase in exclude_phrases)
-        
-        return has_question_word and not has_excluded
+        # Should contain question indicators, and no non-question content
+        return _QUESTION_INDICATORS.search(text_lower) and not _NON_QUESTION_PHRASES.search(text_lower)
+
+    def _filter_valid_questions(self, texts: List[str]) -> List[str]:
+        """Keep the candidates that pass _is_valid_interview_question, in order"""
+        return [t for t in texts if self._is_valid_interview_question(t)]
     
     def _analyze_source_credibility(self, url: str, title: str) -> Dict[str, any]:
         """Analyze the credibility of the source"""
-        credibility_score = 0
-        source_type = "unknown"
-        
         if not url:
             return {"type": "unknown", "score": 0}
         
-        url_lower = url.lower()
-        title_lower = title.lower()
-        
-        # High credibility sources
-        if any(domain in url_lower for domain in ['leetcode.com', 'interviewbit.com', 'geeksforgeeks.org']):
-            credibility_score = 9
-            source_type = "coding_platform"
-        elif any(domain in url_lower for domain in ['glassdoor.co.in', 'glassdoor.com', 'ambitionbox.com']):
-            credibility_score = 8
-            source_type = "job_review"
-        elif any(domain in url_lower for domain in ['github.com', 'stackoverflow.com']):
-            credibility_score = 7
-            source_type = "developer_community"
-        elif any(domain in url_lower for domain in ['medium.com', 'dev.to', 'hackernoon.com']):
-            credibility_score = 6
-            source_type = "tech_blog"
-        elif any(domain in url_lower for domain in ['careercup.com', 'pramp.com']):
-            credibility_score = 8
-            source_type = "interview_prep"
-        elif any(phrase in title_lower for phrase in ['interview experience', 'asked in interview', 'interview questions']):
-            credibility_score += 3
-            source_type = "interview_experience"
-        
-        # Boost score for recent content
-        if any(year in title_lower for year in ['2024', '2023', '2022']):
-            credibility_score += 1
-        
+        source_type, credibility_score = _source_credibility(_url_host(url), title)
         return {"type": source_type, "score": credibility_score}
     
     def _determine_question_difficulty(self, question_text: str, domain: str) -> str:
         """Determine question difficulty based on content and keywords"""
-        question_lower = question_text.lower()
-        
-        # Domain-specific difficulty indicators
-        difficulty_indicators = {
-            'easy': [
-                'what is', 'define', 'explain', 'basic', 'introduction',
-                'difference between', 'types of', 'advantages', 'disadvantages',
-                'simple', 'basic concept', 'fundamental'
-            ],
-            'medium': [
-                'implement', 'design', 'algorithm', 'optimize', 'efficient',
-                'time complexity', 'space complexity', 'approach', 'solution',
-                'strategy', 'method'
-            ],
-            'hard': [
-                'advanced', 'complex', 'distributed', 'scalable', 'architecture',
-                'system design', 'optimization', 'performance', 'large scale',
-                'trade-offs', 'design patterns', 'microservices'
-            ]
-        }
-        
-        easy_count = sum(1 for indicator in difficulty_indicators['easy'] if indicator in question_lower)
-        medium_count = sum(1 for indicator in difficulty_indicators['medium'] if indicator in question_lower)
-        hard_count = sum(1 for indicator in difficulty_indicators['hard'] if indicator in question_lower)
-        
-        if hard_count > 0 or len(question_text) > 200:
-            return "Hard"
-        elif medium_count > easy_count or any(word in question_lower for word in ['implement', 'algorithm', 'code']):
-            return "Medium"
-        else:
-            return "Easy"
+        return _question_difficulty(question_text)
     
     def _classify_question_type(self, question_text: str, domain: str) -> str:
         """Classify the type of interview question"""
-        question_lower = question_text.lower()
-        
-        if any(word in question_lower for word in ['implement', 'write', 'code', 'program', 'function']):
-            return "Coding"
-        elif any(word in question_lower for word in ['design', 'architecture', 'system', 'scalable']):
-            return "System Design"
-        elif any(word in question_lower for word in ['what is', 'define', 'explain', 'describe']):
-            return "Conceptual"
-        elif any(word in question_lower for word in ['difference', 'compare', 'vs', 'versus']):
-            return "Comparison"
-        elif any(word in question_lower for word in ['optimize', 'improve', 'efficient', 'better']):
-            return "Optimization"
-        else:
-            return "General"
+        return _question_type(question_text)
     
     def _extract_company_from_text(self, text: str) -> str:
         """Extract company name from question context"""
-        text_lower = text.lower()
-        
         # Common company indicators
-        company_patterns = [
-            r'(?:at|in|during|from)\s+([A-Z][a-zA-Z\s&.]+?)(?:\s+interview|\s+asked|\s|,|\.|$)',
-            r'([A-Z][a-zA-Z\s&.]+?)\s+(?:interview|asked|company)',
-            r'(?:asked\s+at|interviewed\s+at)\s+([A-Z][a-zA-Z\s&.]+?)(?:\s|,|\.|$)'
-        ]
-        
-        for pattern in company_patterns:
-            matches = re.findall(pattern, text)
+        for pattern in _QUESTION_COMPANY_RES:
+            matches = pattern.findall(text)
             for match in matches:
                 if len(match.strip()) > 1 and len(match.strip()) < 30:
                     return match.strip()
@@ -1211,25 +1911,15 @@ class InterviewQuestionAPI:
     
     def _extract_year_from_text(self, text: str) -> Optional[int]:
         """Extract year from text content"""
-        year_pattern = r'\b(202[0-5]|201[5-9])\b'
-        matches = re.findall(year_pattern, text)
-        if matches:
-            return int(matches[0])
+        match = _QUESTION_YEAR_RE.search(text)
+        if match:
+            return int(match.group(1))
         return None
     
     def _is_safe_url(self, url: str) -> bool:
         """Check if URL is safe to scrape"""
-        if not url:
-            return False
-        
-        safe_domains = [
-            'leetcode.com', 'interviewbit.com', 'geeksforgeeks.org',
-            'glassdoor.co.in', 'glassdoor.com', 'ambitionbox.com',
-            'careercup.com', 'github.com', 'stackoverflow.com',
-            'medium.com', 'dev.to', 'hackernoon.com'
-        ]
-        
-        return any(domain in url.lower() for domain in safe_domains)
+        host = _url_host(url) if url else ''
+        return bool(host) and any(domain in _SAFE_SCRAPE_HOSTS for domain in _parent_domains(host))
     
     def _remove_duplicate_questions(self, questions: List[Dict]) -> List[Dict]:
         """Remove duplicate questions using advanced similarity detection"""
@@ -1237,20 +1927,14 @@ class InterviewQuestionAPI:
             return []
         
         unique_questions = []
-        seen_hashes = set()
+        seen_keys = set()
         
         for question in questions:
-            question_text = question.get('question', '').lower().strip()
-            
-            # Create a normalized version for duplicate detection
-            normalized = re.sub(r'[^\w\s]', '', question_text)
-            normalized = re.sub(r'\s+', ' ', normalized)
+            # Normalized text is the set key; no need for a digest on top of str hashing
+            key = _question_key(question.get('question', ''))
             
-            # Create hash
-            question_hash = hashlib.md5(normalized.encode()).hexdigest()
-            
-            if question_hash not in seen_hashes:
-                seen_hashes.add(question_hash)
+            if key not in seen_keys:
+                seen_keys.add(key)
                 unique_questions.append(question)
         
         return unique_questions
@@ -1260,11 +1944,13 @@ class InterviewQuestionAPI:
         if not questions:
             return []
         
-        # Score questions by relevance
+        # Score questions by relevance - search terms are lowercased once, not per question
         scored_questions = []
+        domain_lower = domain.lower()
+        company_lower = company.lower() if company else None
         
         for question in questions:
-            score = self._calculate_relevance_score(question, domain, company)
+            score = self._calculate_relevance_score(question, domain_lower, company_lower)
             if score > 3:  # Minimum relevance threshold
                 question['relevance_score'] = score
                 scored_questions.append(question)
@@ -1274,19 +1960,17 @@ class InterviewQuestionAPI:
         
         return scored_questions
     
-    def _calculate_relevance_score(self, question: Dict, domain: str, company: str = None) -> int:
-        """Calculate relevance score for a question"""
+    def _calculate_relevance_score(self, question: Dict, domain_lower: str, company_lower: str = None) -> int:
+        """Calculate relevance score for a question against already-lowercased search terms"""
         score = 0
-        question_text = question.get('question', '').lower()
-        question_domain = question.get('domain', '').lower()
-        question_company = question.get('company', '').lower()
         
-        # Domain matching
-        if domain.lower() in question_text or domain.lower() in question_domain:
+        # Domain matching - the short domain field first, the question text only if needed
+        if (domain_lower in question.get('domain', '').lower() or
+                domain_lower in question.get('question', '').lower()):
             score += 5
         
         # Company matching
-        if company and company.lower() in question_company:
+        if company_lower and company_lower in question.get('company', '').lower():
             score += 8
         
         # Source credibility
@@ -1299,17 +1983,9 @@ class InterviewQuestionAPI:
         elif year and year >= 2020:
             score += 1
         
-        # Question type preference
-        question_type = question.get('question_type', '')
-        if question_type in ['Coding', 'System Design']:
-            score += 2
-        
-        # Difficulty distribution
-        difficulty = question.get('difficulty', '')
-        if difficulty == 'Medium':
-            score += 2
-        elif difficulty == 'Hard':
-            score += 1
+        # Question type preference and difficulty distribution
+        score += _QUESTION_TYPE_BONUS.get(question.get('question_type', ''), 0)
+        score += _DIFFICULTY_BONUS.get(question.get('difficulty', ''), 0)
         
         return score
     
@@ -1319,115 +1995,114 @@ class InterviewQuestionAPI:
             return []
         
         self.emit_status(f"🤖 Generating detailed solutions for {len(questions)} questions...")
-        
-        enhanced_questions = []
-        batch_size = 5  # Process in batches to manage API rate limits
-        
-        for i in range(0, len(questions), batch_size):
-            batch = questions[i:i+batch_size]
-            
-            for j, question in enumerate(batch):
-                try:
-                    self.emit_status(f"💡 Generating solution {i+j+1}/{len(questions)}...")
-                    
-                    solution = self._generate_comprehensive_solution(
-                        question['question'], 
-                        domain, 
-                        company,
-                        question.get('difficulty', 'Medium'),
-                        question.get('question_type', 'General')
-                    )
-                    
-                    question['solution'] = solution
-                    enhanced_questions.append(question)
-                    
-                    # Small delay between API calls
-                    time.sleep(0.5)
-                    
-                except Exception as e:
-                    logger.error(f"Error generating solution for question {i+j+1}: {e}")
-                    question['solution'] = self._get_fallback_solution(question['question'], domain)
-                    enhanced_questions.append(question)
-            
-            # Longer delay between batches
-            if i + batch_size < len(questions):
-                time.sleep(2)
-        
-        self.emit_status(f"✅ Generated solutions for all questions!")
-        return enhanced_questions
-    
-    def _generate_comprehensive_solution(self, question: str, domain: str, company: str = None, 
-                                       difficulty: str = "Medium", question_type: str = "General") -> str:
-        """Generate comprehensive solution using Gemini AI"""
-        try:
-            url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-1.5-flash:generateContent?key={GEMINI_API_KEY}"
-            
-            # Create context-aware prompt
-            company_context = f" (specifically asked at {company})" if company else ""
-            
-            prompt = f"""
-You are an expert technical interviewer and educator. Provide a comprehensive answer to this {domain} interview question{company_context}:
 
-**Question:** {question}
+        # Questions answered in any earlier search are served from the solution cache,
+        # looked up in one query, and never reach Gemini again
+        cache_keys = [
+            _solution_cache_key(question['question'], domain, company,
+                                question.get('difficulty', 'Medium'), question.get('question_type', 'General'))
+            for question in questions
+        ]
+        cached_solutions = solution_cache.get_many(cache_keys)
 
-**Context:**
-- Domain: {domain}
-- Difficulty Level: {difficulty}
-- Question Type: {question_type}
-- Target Audience: Fresh graduates and 4th year students from Indian engineering colleges
+        pending = []
+        for question, cache_key in zip(questions, cache_keys):
+            if cache_key in cached_solutions:
+                question['solution'] = cached_solutions[cache_key]
+            else:
+                pending.append(question)
 
-Please provide a structured response with:
+        def enhance(question: Dict):
+            try:
+                question['solution'] = self._generate_comprehensive_solution(
+                    question['question'],
+                    domain,
+                    company,
+                    question.get('difficulty', 'Medium'),
+                    question.get('question_type', 'General')
+                )
 
-## 1. Concept Explanation
-- Clear explanation of the underlying concept
-- Key terminology and definitions
-- Why this concept is important in {domain}
+            except Exception as e:
+                logger.error(f"Error generating solution for question '{question['question'][:50]}': {e}")
+                question['solution'] = self._get_fallback_solution(question['question'], domain)
 
-## 2. Detailed Solution
-- Step-by-step approach to solve this problem
-- Multiple approaches if applicable (brute force, optimized, etc.)
-- Time and space complexity analysis (if applicable)
+        def enhance_batch(start: int):
+            batch = pending[start:start + SOLUTION_BATCH_SIZE]
+            self.emit_status(f"💡 Generating solutions {start + 1}-{start + len(batch)}/{len(pending)}...")
 
-## 3. Code Implementation (if applicable)
-- Clean, well-commented code in Python or Java
-- Include input/output examples
-- Handle edge cases
+            solutions = self._generate_batch_solutions(batch, domain, company) if len(batch) > 1 else {}
+            for index, question in enumerate(batch):
+                solution = solutions.get(index)
+                if _is_usable_solution(solution):
+                    question['solution'] = solution
+                    solution_cache.set(_solution_cache_key(
+                        question['question'], domain, company,
+                        question.get('difficulty', 'Medium'), question.get('question_type', 'General')
+                    ), solution, SOLUTION_CACHE_TTL)
+                else:
+                    # Answered on its own when the batch reply didn't cover it
+                    enhance(question)
 
-## 4. Key Points for Interview
-- Important points to remember and mention
-- Common mistakes to avoid
-- Follow-up questions you might be asked
+        # Batches are generated concurrently; gemini_limiter paces the API calls
+        with ThreadPoolExecutor(max_workers=GEMINI_CONCURRENCY) as executor:
+            list(executor.map(enhance_batch, range(0, len(pending), SOLUTION_BATCH_SIZE)))
 
-## 5. Related Concepts
-- Connected topics you should know
-- How this fits into the broader {domain} landscape
+        self.emit_status(f"✅ Generated solutions for all questions!")
+        return questions
 
-Keep the explanation:
-- Beginner-friendly but technically accurate
-- Focused on Indian job market expectations
-- Include practical examples where possible
-- Maximum 500 words for clarity
+    def _generate_batch_solutions(self, batch: List[Dict], domain: str, company: str = None) -> Dict[int, str]:
+        """Answer several questions with one Gemini request returning a JSON array
 
-Format the response in clean markdown with proper headers and code blocks.
-"""
+        Returns solutions by position in batch; questions missing from the reply, or
+        every question when the request or its JSON fails, are simply left out.
+        """
+        try:
+            company_context = f" (specifically asked at {company})" if company else ""
+            question_lines = "\n".join(
+                f"{i}. [Difficulty: {q.get('difficulty', 'Medium')} | Type: {q.get('question_type', 'General')}] {q['question']}"
+                for i, q in enumerate(batch, 1)
+            )
             
-            payload = {
-                "contents": [{
-                    "parts": [{"text": prompt}]
-                }]
-            }
+            prompt = BATCH_SOLUTION_PROMPT.format(
+                count=len(batch), domain=domain, company_context=company_context, question_lines=question_lines
+            )
+
+            reply = gemini_generate(prompt, timeout=90, generation_config={
+                "responseMimeType": "application/json",
+                "maxOutputTokens": SOLUTION_BATCH_MAX_TOKENS
+            })
+            return _batch_solutions_from_reply(reply, len(batch))
             
-            headers = {'Content-Type': 'application/json'}
+        except Exception as e:
+            logger.error(f"Batch solution generation failed: {e}")
+            return {}
+
+    def _generate_comprehensive_solution(self, question: str, domain: str, company: str = None,
+                                       difficulty: str = "Medium", question_type: str = "General") -> str:
+        """Generate comprehensive solution using Gemini AI
+
+        Solutions are cached per normalized question and prompt context, so a question
+        that recurs across searches is only sent to Gemini once.
+        """
+        cache_key = _solution_cache_key(question, domain, company, difficulty, question_type)
+        cached = solution_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            # Create context-aware prompt
+            company_context = f" (specifically asked at {company})" if company else ""
             
-            response = requests.post(url, json=payload, headers=headers, timeout=30)
+            prompt = SOLUTION_PROMPT.format(
+                domain=domain, company_context=company_context, question=question,
+                difficulty=difficulty, question_type=question_type
+            )
             
-            if response.status_code == 200:
-                result = response.json()
-                solution = result['candidates'][0]['content']['parts'][0]['text']
-                return solution.strip()
-            else:
-                logger.error(f"Gemini API error: {response.status_code}")
-                return self._get_fallback_solution(question, domain)
+            solution = gemini_generate(prompt).strip()
+            if not _is_usable_solution(solution):
+                raise Exception(f"Gemini returned an unusable solution: {solution[:50]!r}")
+            solution_cache.set(cache_key, solution, SOLUTION_CACHE_TTL)
+            return solution
                 
         except Exception as e:
             logger.error(f"AI solution generation failed: {e}")
@@ -1464,71 +2139,141 @@ This is a fundamental {domain} question that requires understanding of core conc
 *For a detailed solution, please refer to standard {domain} resources or consult with technical mentors.*
 """
 
+# Deletes markdown heading markers from solution paragraphs before layout
+_STRIP_HASH_TBL = str.maketrans('', '', '#')
+
+def _build_pdf_styles():
+    """Sample stylesheet extended with the report's custom styles"""
+    styles = getSampleStyleSheet()
+    styles.add(ParagraphStyle(
+        name='CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        spaceAfter=30,
+        textColor=colors.darkblue,
+        alignment=TA_CENTER
+    ))
+    styles.add(ParagraphStyle(
+        name='QuestionStyle',
+        parent=styles['Heading2'],
+        fontSize=14,
+        spaceAfter=12,
+        textColor=colors.darkred,
+        leftIndent=10
+    ))
+    styles.add(ParagraphStyle(
+        name='SolutionStyle',
+        parent=styles['Normal'],
+        fontSize=11,
+        spaceAfter=20,
+        leftIndent=20,
+        rightIndent=10,
+        alignment=TA_JUSTIFY
+    ))
+    styles.add(ParagraphStyle(
+        name='HeaderStyle',
+        parent=styles['Normal'],
+        fontSize=12,
+        textColor=colors.blue,
+        spaceAfter=6
+    ))
+    return styles
+
+# Styles and static paragraphs are built once per process rather than per report;
+# each placement takes a shallow copy so layout state never leaks between uses
+PDF_STYLES = _build_pdf_styles()
+_SOLUTION_LABEL = Paragraph("<b>Solution:</b>", PDF_STYLES['Normal'])
+_STANDARD_FOOTER = Paragraph("<i>Generated by SIT Career Platform - Symbiosis Institute of Technology, Pune</i>",
+                             PDF_STYLES['Normal'])
+_ENHANCED_FOOTER = Paragraph(
+    "<i>Generated by SIT Career Platform - Symbiosis Institute of Technology, Pune<br/>"
+    "For academic and career preparation purposes only<br/>"
+    "Contact: career.services@sitpune.edu.in</i>",
+    PDF_STYLES['Normal']
+)
+
+PDF_STORY_LOOKAHEAD = 32  # flowables buffered ahead of layout - covers any keep-with-next chain in the reports
+
+class LazyStory(list):
+    """Story list for doc.build() that pulls flowables from an iterator as layout consumes them
+
+    build() only reads the head of the story (plus a short keep-with-next lookahead)
+    and deletes each flowable once it is placed, so topping the buffer up to
+    PDF_STORY_LOOKAHEAD entries keeps just those alive instead of the whole report.
+    """
+
+    def __init__(self, flowables: Iterable[Flowable], lookahead: int = PDF_STORY_LOOKAHEAD):
+        super().__init__()
+        self._source: Optional[Iterator[Flowable]] = iter(flowables)
+        self._lookahead = lookahead
+
+    def _fill(self):
+        while self._source is not None and list.__len__(self) < self._lookahead:
+            try:
+                self.append(next(self._source))
+            except StopIteration:
+                self._source = None
+
+    def __len__(self) -> int:
+        self._fill()
+        return list.__len__(self)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __getitem__(self, index):
+        self._fill()
+        return list.__getitem__(self, index)
+
 class PDFGenerator:
     """Generate professional PDF reports for interview questions"""
     
     def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
-    
-    def _setup_custom_styles(self):
-        """Setup custom styles for PDF"""
-        self.styles.add(ParagraphStyle(
-            name='CustomTitle',
-            parent=self.styles['Heading1'],
-            fontSize=24,
-            spaceAfter=30,
-            textColor=colors.darkblue,
-            alignment=TA_CENTER
-        ))
-        self.styles.add(ParagraphStyle(
-            name='QuestionStyle',
-            parent=self.styles['Heading2'],
-            fontSize=14,
-            spaceAfter=12,
-            textColor=colors.darkred,
-            leftIndent=10
-        ))
-        self.styles.add(ParagraphStyle(
-            name='SolutionStyle',
-            parent=self.styles['Normal'],
-            fontSize=11,
-            spaceAfter=20,
-            leftIndent=20,
-            rightIndent=10,
-            alignment=TA_JUSTIFY
-        ))
-        self.styles.add(ParagraphStyle(
-            name='HeaderStyle',
-            parent=self.styles['Normal'],
-            fontSize=12,
-            textColor=colors.blue,
-            spaceAfter=6
-        ))
+        self.styles = PDF_STYLES
+
+    def _create_document(self, buffer) -> SimpleDocTemplate:
+        """Create the A4 document template shared by all reports
+
+        Page streams are compressed, which roughly halves the size of text-heavy
+        solution reports.
+        """
+        return SimpleDocTemplate(buffer, pagesize=A4, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=18,
+                                 pageCompression=1)
+
+    def _build_document(self, flowables: Iterable[Flowable]) -> io.BytesIO:
+        """Lay out flowables into a new PDF and return it rewound
+
+        Flowables are generated only as layout reaches them, so a long report never
+        holds all of its parsed paragraphs in memory at once.
+        """
+        buffer = io.BytesIO()
+        self._create_document(buffer).build(LazyStory(flowables))
+        buffer.seek(0)
+        return buffer
     
     def generate_pdf(self, domain: str, questions: List[Dict], company: str = None) -> io.BytesIO:
         """Generate standard PDF report for interview questions"""
-        buffer = io.BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=18)
-        story = []
-        
+        return self._build_document(self._iter_standard_flowables(domain, questions, company))
+
+    def _iter_standard_flowables(self, domain: str, questions: List[Dict], company: str = None) -> Iterator[Flowable]:
+        """Yield the standard report's flowables in page order"""
         title_text = f"{domain} Interview Questions"
         if company:
             title_text += f" - {company}"
-        story.append(Paragraph(title_text, self.styles['CustomTitle']))
-        story.append(Spacer(1, 20))
+        yield Paragraph(title_text, self.styles['CustomTitle'])
+        yield Spacer(1, 20)
         
-        story.append(Paragraph(f"<b>Domain:</b> {domain}", self.styles['HeaderStyle']))
+        yield Paragraph(f"<b>Domain:</b> {domain}", self.styles['HeaderStyle'])
         if company:
-            story.append(Paragraph(f"<b>Company:</b> {company}", self.styles['HeaderStyle']))
-        story.append(Paragraph(f"<b>Total Questions:</b> {len(questions)}", self.styles['HeaderStyle']))
-        story.append(Paragraph(f"<b>Generated on:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", self.styles['HeaderStyle']))
-        story.append(Paragraph(f"<b>Prepared for:</b> SIT Pune Students", self.styles['HeaderStyle']))
-        story.append(Spacer(1, 30))
+            yield Paragraph(f"<b>Company:</b> {company}", self.styles['HeaderStyle'])
+        yield Paragraph(f"<b>Total Questions:</b> {len(questions)}", self.styles['HeaderStyle'])
+        yield Paragraph(f"<b>Generated on:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", self.styles['HeaderStyle'])
+        yield Paragraph(f"<b>Prepared for:</b> SIT Pune Students", self.styles['HeaderStyle'])
+        yield Spacer(1, 30)
         
         for i, question in enumerate(questions, 1):
             question_text = f"Q{i}. {question.get('question', 'N/A')}"
-            story.append(Paragraph(question_text, self.styles['QuestionStyle']))
+            yield Paragraph(question_text, self.styles['QuestionStyle'])
             
             metadata = []
             if question.get('company') and question.get('company') != 'Various Companies':
@@ -1539,64 +2284,67 @@ class PDFGenerator:
                 metadata.append(f"Difficulty: {question['difficulty']}")
             
             if metadata:
-                story.append(Paragraph(f"<i>{' | '.join(metadata)}</i>", self.styles['Normal']))
-                story.append(Spacer(1, 6))
+                yield Paragraph(f"<i>{' | '.join(metadata)}</i>", self.styles['Normal'])
+                yield Spacer(1, 6)
             
             solution = question.get('solution', 'Solution not available.')
-            story.append(Paragraph(f"<b>Solution:</b>", self.styles['Normal']))
-            story.append(Paragraph(solution, self.styles['SolutionStyle']))
+            yield copy.copy(_SOLUTION_LABEL)
+            yield Paragraph(solution, self.styles['SolutionStyle'])
             
             if i % 3 == 0 and i < len(questions):
-                story.append(PageBreak())
+                yield PageBreak()
             else:
-                story.append(Spacer(1, 20))
+                yield Spacer(1, 20)
         
-        story.append(Spacer(1, 30))
-        story.append(Paragraph("<i>Generated by SIT Career Platform - Symbiosis Institute of Technology, Pune</i>", 
-                              self.styles['Normal']))
-        
-        doc.build(story)
-        buffer.seek(0)
-        return buffer
+        yield Spacer(1, 30)
+        yield copy.copy(_STANDARD_FOOTER)
     
     def generate_enhanced_pdf(self, domain: str, questions: List[Dict], company: str = None, 
                             include_solutions: bool = True, difficulty_filter: str = 'all') -> io.BytesIO:
         """Generate enhanced PDF report with filtering and customizable options"""
-        buffer = io.BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=18)
-        story = []
-        
+        try:
+            return self._build_document(self._iter_enhanced_flowables(
+                domain, questions, company, include_solutions, difficulty_filter
+            ))
+        except Exception as e:
+            logger.error(f"PDF build error: {str(e)}")
+            raise Exception(f"Failed to build PDF: {str(e)}")
+
+    def _iter_enhanced_flowables(self, domain: str, questions: List[Dict], company: str,
+                                 include_solutions: bool, difficulty_filter: str) -> Iterator[Flowable]:
+        """Yield the enhanced report's flowables in page order"""
         # Filter questions by difficulty if specified
+        difficulty = difficulty_filter.lower()
         filtered_questions = questions
-        if difficulty_filter.lower() != 'all':
-            filtered_questions = [q for q in questions if q.get('difficulty', '').lower() == difficulty_filter.lower()]
+        if difficulty != 'all':
+            filtered_questions = [q for q in questions if str(q.get('difficulty') or '').lower() == difficulty]
         
         # Title with enhanced details
         title_text = f"{domain} Interview Preparation"
         if company:
             title_text += f" - {company}"
-        if difficulty_filter.lower() != 'all':
+        if difficulty != 'all':
             title_text += f" ({difficulty_filter.title()} Difficulty)"
-        story.append(Paragraph(title_text, self.styles['CustomTitle']))
-        story.append(Spacer(1, 20))
+        yield Paragraph(title_text, self.styles['CustomTitle'])
+        yield Spacer(1, 20)
         
         # Enhanced header with more metadata
-        story.append(Paragraph(f"<b>Domain:</b> {domain}", self.styles['HeaderStyle']))
+        yield Paragraph(f"<b>Domain:</b> {domain}", self.styles['HeaderStyle'])
         if company:
-            story.append(Paragraph(f"<b>Company:</b> {company}", self.styles['HeaderStyle']))
-        story.append(Paragraph(f"<b>Total Questions:</b> {len(filtered_questions)}", self.styles['HeaderStyle']))
-        story.append(Paragraph(f"<b>Difficulty:</b> {difficulty_filter.title() if difficulty_filter.lower() != 'all' else 'All Levels'}", 
-                             self.styles['HeaderStyle']))
-        story.append(Paragraph(f"<b>Solutions Included:</b> {include_solutions}", self.styles['HeaderStyle']))
-        story.append(Paragraph(f"<b>Generated on:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", 
-                             self.styles['HeaderStyle']))
-        story.append(Paragraph(f"<b>Prepared for:</b> SIT Pune Students & Graduates", self.styles['HeaderStyle']))
-        story.append(Spacer(1, 30))
+            yield Paragraph(f"<b>Company:</b> {company}", self.styles['HeaderStyle'])
+        yield Paragraph(f"<b>Total Questions:</b> {len(filtered_questions)}", self.styles['HeaderStyle'])
+        yield Paragraph(f"<b>Difficulty:</b> {difficulty_filter.title() if difficulty != 'all' else 'All Levels'}",
+                        self.styles['HeaderStyle'])
+        yield Paragraph(f"<b>Solutions Included:</b> {include_solutions}", self.styles['HeaderStyle'])
+        yield Paragraph(f"<b>Generated on:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                        self.styles['HeaderStyle'])
+        yield Paragraph(f"<b>Prepared for:</b> SIT Pune Students & Graduates", self.styles['HeaderStyle'])
+        yield Spacer(1, 30)
         
         # Add questions with enhanced formatting
         for i, question in enumerate(filtered_questions, 1):
             question_text = f"Q{i}. {question.get('question', 'N/A')}"
-            story.append(Paragraph(question_text, self.styles['QuestionStyle']))
+            yield Paragraph(question_text, self.styles['QuestionStyle'])
             
             # Enhanced metadata
             metadata = []
@@ -1612,47 +2360,207 @@ class PDFGenerator:
                 metadata.append(f"Source: <link href='{question['source_url']}' color='blue'>{question.get('source_title', 'Link')}</link>")
             
             if metadata:
-                story.append(Paragraph(f"<i>{' | '.join(metadata)}</i>", self.styles['Normal']))
-                story.append(Spacer(1, 8))
+                yield Paragraph(f"<i>{' | '.join(metadata)}</i>", self.styles['Normal'])
+                yield Spacer(1, 8)
             
             # Conditionally include solutions
             if include_solutions:
                 solution = question.get('solution', 'Solution not available.')
-                story.append(Paragraph(f"<b>Solution:</b>", self.styles['Normal']))
-                # Split solution into paragraphs for better readability
-                solution_paragraphs = solution.split('\n\n')
-                for para in solution_paragraphs:
-                    cleaned_para = re.sub(r'#+', '', para).strip()  # Remove markdown headers
-                    story.append(Paragraph(cleaned_para, self.styles['SolutionStyle']))
+                yield copy.copy(_SOLUTION_LABEL)
+                # Split solution into paragraphs for better readability, removing markdown headers
+                solution_style = self.styles['SolutionStyle']
+                for para in solution.split('\n\n'):
+                    yield Paragraph(para.translate(_STRIP_HASH_TBL).strip(), solution_style)
             
             # Add source credibility if available
             if question.get('credibility_score'):
-                story.append(Paragraph(f"<i>Source Credibility Score: {question['credibility_score']}/10</i>", 
-                                     self.styles['Normal']))
+                yield Paragraph(f"<i>Source Credibility Score: {question['credibility_score']}/10</i>",
+                                self.styles['Normal'])
             
             # Page break logic
             if i % 2 == 0 and i < len(filtered_questions):
-                story.append(PageBreak())
+                yield PageBreak()
             else:
-                story.append(Spacer(1, 25))
+                yield Spacer(1, 25)
         
         # Enhanced footer
-        story.append(Spacer(1, 40))
-        footer_text = (
-            "<i>Generated by SIT Career Platform - Symbiosis Institute of Technology, Pune<br/>"
-            "For academic and career preparation purposes only<br/>"
-            f"Contact: career.services@sitpune.edu.in</i>"
-        )
-        story.append(Paragraph(footer_text, self.styles['Normal']))
-        
+        yield Spacer(1, 40)
+        yield copy.copy(_ENHANCED_FOOTER)
+
+# PDF rendering runs in worker processes so doc.build() doesn't hold the GIL
+# against the request threads and the Socket.IO emit loop. Workers are spawned,
+# not forked - forking would copy this process's threads, SQLite connections
+# and any eventlet/gevent monkey-patching into them.
+PDF_WORKERS = 2
+PDF_BUILD_TIMEOUT = 120  # seconds
+PDF_SPOOL_MAX_BYTES = 256 * 1024  # larger PDFs are handed back through a temp file and streamed from disk
+
+_pdf_executor: Optional[ProcessPoolExecutor] = None
+_pdf_executor_lock = threading.Lock()
+
+def get_pdf_executor() -> ProcessPoolExecutor:
+    """Return the shared PDF process pool, starting it on first use"""
+    global _pdf_executor
+    with _pdf_executor_lock:
+        if _pdf_executor is None:
+            _pdf_executor = ProcessPoolExecutor(max_workers=PDF_WORKERS, initializer=_init_pdf_worker,
+                                                mp_context=multiprocessing.get_context('spawn'))
+        return _pdf_executor
+
+def _discard_pdf_executor(broken: ProcessPoolExecutor):
+    """Drop a pool whose workers died, so the next get_pdf_executor() starts a fresh one"""
+    global _pdf_executor
+    with _pdf_executor_lock:
+        if _pdf_executor is broken:
+            _pdf_executor = None
+    broken.shutdown(wait=False)
+
+def run_pdf_job(fn, *args, timeout: float = PDF_BUILD_TIMEOUT, discard=None):
+    """Run fn(*args) in the PDF pool and return its result
+
+    If a worker has died (OOM, a crash inside reportlab) the pool is broken for
+    every later job, so it is replaced and the job retried once. On timeout the
+    job keeps running; discard, if given, is called with its result when it
+    eventually finishes, since nobody is left to use it.
+    """
+    for attempt in range(2):
+        executor = get_pdf_executor()
         try:
-            doc.build(story)
-        except Exception as e:
-            logger.error(f"PDF build error: {str(e)}")
-            raise Exception(f"Failed to build PDF: {str(e)}")
-        
-        buffer.seek(0)
-        return buffer
+            future = executor.submit(fn, *args)
+            try:
+                return future.result(timeout=timeout)
+            except FutureTimeoutError:
+                if discard is not None:
+                    def discard_late_result(done: Future):
+                        if not done.cancelled() and done.exception() is None:
+                            discard(done.result())
+                    future.add_done_callback(discard_late_result)
+                raise
+        except BrokenProcessPool:
+            _discard_pdf_executor(executor)
+            if attempt:
+                raise
+            logger.warning("PDF worker pool broke, restarting it")
+
+@lru_cache(maxsize=1)
+def _worker_pdf_generator() -> PDFGenerator:
+    """PDFGenerator owned by the current worker process"""
+    return PDFGenerator()
+
+def _init_pdf_worker():
+    """Build the worker's stylesheet as soon as the process starts, not on its first PDF"""
+    _worker_pdf_generator()
+
+def _pdf_worker_ready():
+    """No-op job - submitting it makes the pool start a worker, whose initializer does the setup"""
+
+def warm_pdf_workers():
+    """Start the PDF worker processes ahead of the first download request"""
+    executor = get_pdf_executor()
+    for _ in range(PDF_WORKERS):
+        executor.submit(_pdf_worker_ready)
+
+def build_enhanced_pdf(domain: str, questions: List[Dict], company: str = None,
+                       include_solutions: bool = True, difficulty_filter: str = 'all') -> Union[bytes, str]:
+    """Render an enhanced interview PDF inside a worker process
+
+    Returns the PDF bytes, or for reports over PDF_SPOOL_MAX_BYTES the path of a temp
+    file holding them - the caller streams that from disk and removes it, so large
+    reports are never pickled back or held in the request process.
+    """
+    buffer = _worker_pdf_generator().generate_enhanced_pdf(
+        domain, questions, company, include_solutions, difficulty_filter
+    )
+    if buffer.getbuffer().nbytes <= PDF_SPOOL_MAX_BYTES:
+        return buffer.getvalue()
+
+    with tempfile.NamedTemporaryFile(prefix='interview_prep_', suffix='.pdf', delete=False) as spool:
+        spool.write(buffer.getbuffer())
+    return spool.name
+
+def discard_pdf(pdf: Union[bytes, str]):
+    """Remove the temp file behind a spooled build_enhanced_pdf result that won't be sent"""
+    if isinstance(pdf, str):
+        try:
+            os.unlink(pdf)
+        except OSError:
+            pass
+
+class DeleteOnCloseFile(io.FileIO):
+    """Read handle on a spilled PDF that removes the file when the download closes it
+
+    send_file responses bypass Response.call_on_close, but the WSGI server always
+    closes the file it was streaming.
+    """
+
+    def __init__(self, path: str):
+        super().__init__(path, 'rb')
+
+    def close(self):
+        try:
+            super().close()
+        finally:
+            try:
+                os.remove(self.name)
+            except FileNotFoundError:
+                pass
+
+# Cross-source near-duplicate detection
+SIMHASH_MAX_DISTANCE = 3  # max differing bits for two listings to count as the same job
+_TOKEN_RE = re.compile(r'\w+')
+
+def _simhash(tokens: List[str]) -> int:
+    """64-bit SimHash - near-identical token sets map to hashes only a few bits apart"""
+    weights = [0] * 64
+    for token in tokens:
+        token_hash = int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'little')
+        for bit in range(64):
+            weights[bit] += 1 if (token_hash >> bit) & 1 else -1
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+class SimHashIndex:
+    """Set of 64-bit SimHashes answering "is any stored hash within max_distance bits?"
+
+    Hashes are split into max_distance + 1 bit bands. Two hashes differing in at most
+    max_distance bits must agree exactly on at least one band, so only hashes sharing
+    a band with the query are compared instead of every stored hash.
+    """
+
+    def __init__(self, max_distance: int = SIMHASH_MAX_DISTANCE):
+        self.max_distance = max_distance
+        bands = max_distance + 1
+        bounds = [64 * i // bands for i in range(bands + 1)]
+        self._bands = [(start, (1 << (end - start)) - 1) for start, end in zip(bounds, bounds[1:])]
+        self._buckets: Dict[Tuple[int, int], List[int]] = {}
+
+    def _band_keys(self, simhash: int) -> List[Tuple[int, int]]:
+        """(band number, band bits) bucket keys of simhash"""
+        return [(band, (simhash >> start) & mask) for band, (start, mask) in enumerate(self._bands)]
+
+    def has_near(self, simhash: int) -> bool:
+        """True if a stored hash differs from simhash in at most max_distance bits"""
+        return any(bin(simhash ^ other).count('1') <= self.max_distance
+                   for key in self._band_keys(simhash)
+                   for other in self._buckets.get(key, ()))
+
+    def add(self, simhash: int):
+        """Store simhash under each of its bands"""
+        for key in self._band_keys(simhash):
+            self._buckets.setdefault(key, []).append(simhash)
+
+# Job relevance scoring - keyword tables built once, not per scored job
+_RELEVANCE_AI_ML_KEYWORDS = KeywordSet(['ai', 'ml', 'machine learning', 'artificial intelligence',
+                                        'deep learning', 'neural network', 'nlp', 'computer vision',
+                                        'data science', 'tensorflow', 'pytorch'])
+_FRESHER_LEVEL_KEYWORDS = KeywordSet(['entry', 'fresher', '0-1', 'graduate'])
+
+@lru_cache(maxsize=EXTRACTOR_CACHE_SIZE)
+def _days_since_posted(posted_date: str, today: date) -> Optional[int]:
+    """Age in days of a YYYY-MM-DD posting date, or None if it doesn't parse"""
+    try:
+        return (today - datetime.strptime(posted_date, '%Y-%m-%d').date()).days
+    except (TypeError, ValueError):
+        return None
 
 class JobSearchEngine:
     """Main class that orchestrates all job search operations"""
@@ -1672,7 +2580,7 @@ class JobSearchEngine:
         results = {
             'job_role': job_role,
             'location': location,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now_iso(),
             'total_jobs': 0,
             'sources': {},
             'all_jobs': [],
@@ -1683,45 +2591,40 @@ class JobSearchEngine:
         experience_level = filters.get('experience_level', 'entry')
         
         try:
-            socketio.emit('search_started', {
+            queue_event('search_started', {
                 'message': f"Starting comprehensive search for {job_role} AI/ML jobs in {location}...",
                 'job_role': job_role,
                 'location': location
             })
             
-            # Use ThreadPoolExecutor for concurrent searches
-            search_tasks = []
+            # Use ThreadPoolExecutor for concurrent searches - one worker per source so
+            # wall time is bounded by the slowest source; serpapi_limiter paces the queries
+            source_searches = {
+                'linkedin': (self.linkedin_api, {'experience_level': experience_level}),
+                'naukri': (self.naukri_api, {'experience': filters.get('experience', '0-1')}),
+                'indeed': (self.indeed_api, {}),
+                'freshersworld': (self.freshers_api, {}),
+                'monster': (self.monster_api, {}),
+            }
             
-            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-                # Submit search tasks
-                search_tasks.append(
-                    executor.submit(self._safe_search, self.linkedin_api, job_role, location, experience_level=experience_level)
-                )
-                search_tasks.append(
-                    executor.submit(self._safe_search, self.naukri_api, job_role, location, experience=filters.get('experience', '0-1'))
-                )
-                search_tasks.append(
-                    executor.submit(self._safe_search, self.indeed_api, job_role, location)
-                )
-                search_tasks.append(
-                    executor.submit(self._safe_search, self.freshers_api, job_role, location)
-                )
-                search_tasks.append(
-                    executor.submit(self._safe_search, self.monster_api, job_role, location)
-                )
+            with ThreadPoolExecutor(max_workers=len(source_searches)) as executor:
+                # Submit search tasks, remembering which source each future belongs to -
+                # as_completed yields in finishing order, not submission order
+                search_tasks = {
+                    executor.submit(self._safe_search, api, job_role, location, **kwargs): source_name
+                    for source_name, (api, kwargs) in source_searches.items()
+                }
                 
                 # Collect results as they complete
-                source_names = ['linkedin', 'naukri', 'indeed', 'freshersworld', 'monster']
-                
-                for i, future in enumerate(as_completed(search_tasks)):
+                for future in as_completed(search_tasks):
                     try:
                         source_jobs = future.result(timeout=30)  # 30 second timeout
-                        source_name = source_names[i] if i < len(source_names) else f'source_{i}'
+                        source_name = search_tasks[future]
                         
                         results['sources'][source_name] = source_jobs
                         results['all_jobs'].extend(source_jobs)
                         
-                        socketio.emit('source_completed', {
+                        queue_event('source_completed', {
                             'source': source_name,
                             'job_count': len(source_jobs),
                             'total_so_far': len(results['all_jobs'])
@@ -1732,7 +2635,7 @@ class JobSearchEngine:
                         continue
             
             # Process and rank results
-            socketio.emit('thought', {
+            queue_thought({
                 'agent': 'System',
                 'message': "Processing and ranking results..."
             })
@@ -1744,18 +2647,33 @@ class JobSearchEngine:
             # Add search summary
             results['summary'] = self._generate_search_summary(results)
             
-            socketio.emit('search_completed', results)
+            queue_event('search_completed', results, final=True)
             
         except Exception as e:
             logger.error(f"Comprehensive search failed: {e}")
             results['search_status'] = 'failed'
             results['error'] = str(e)
-            socketio.emit('search_failed', results)
+            queue_event('search_failed', results, final=True)
+            raise  # so the search's task reports failed to /search-status
+
+    def _interview_cache_key(self, domain: str, company: Optional[str], difficulty: str, question_count: int) -> str:
+        """Cache key for an interview search, ignoring case and spacing in the company name"""
+        return PersistentTTLCache.make_key(
+            domain,
+            _WHITESPACE_RE.sub(' ', company).strip().casefold() if company else None,
+            difficulty,
+            question_count
+        )
+
+    def cached_interview_results(self, domain: str, company: str = None, difficulty: str = "all",
+                                 question_count: int = 10) -> Optional[Dict]:
+        """Results of an identical interview search from the last INTERVIEW_CACHE_TTL seconds, if any"""
+        return interview_cache.get(self._interview_cache_key(domain, company, difficulty, question_count))
     
     def search_interview_questions(self, domain: str, company: str = None, difficulty: str = "all", question_count: int = 10):
         """Enhanced interview question search method"""
         try:
-            socketio.emit('interview_search_started', {
+            queue_event('interview_search_started', {
                 'message': f"🔍 Starting comprehensive search for {domain} questions from {company or 'various companies'}...",
                 'domain': domain,
                 'company': company,
@@ -1782,19 +2700,25 @@ class JobSearchEngine:
                     'ai_enhanced': True,
                     'recent_questions_only': True
                 },
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now_iso()
             }
             
-            socketio.emit('interview_search_completed', results)
+            # Empty results are usually a transient upstream failure - let the next request retry
+            if questions:
+                interview_cache.set(self._interview_cache_key(domain, company, difficulty, question_count),
+                                    results, INTERVIEW_CACHE_TTL)
+
+            queue_event('interview_search_completed', results, final=True)
             
         except Exception as e:
             logger.error(f"Enhanced interview question search failed: {e}")
-            socketio.emit('interview_search_failed', {
+            queue_event('interview_search_failed', {
                 'error': str(e),
                 'domain': domain,
                 'company': company,
-                'timestamp': datetime.now().isoformat()
-            })
+                'timestamp': now_iso()
+            }, final=True)
+            raise  # so the search's task reports failed to /search-status
     
     def _safe_search(self, api_instance, job_role: str, location: str, **kwargs) -> List[Dict]:
         """Safely execute search with error handling"""
@@ -1807,16 +2731,27 @@ class JobSearchEngine:
     def _remove_duplicates_and_rank(self, jobs: List[Dict], job_role: str) -> List[Dict]:
         """Remove duplicate jobs and rank by relevance"""
         seen_jobs = set()
+        kept_simhashes = SimHashIndex()
         unique_jobs = []
+        job_role_lower = job_role.lower()
+        role_keywords = job_role_lower.split()
+        today = date.today()
         
         for job in jobs:
             # Create a more robust hash based on title, company, and description
             job_hash = self._create_job_hash(job)
             
             if job_hash not in seen_jobs and self._is_valid_job(job):
+                # The same posting syndicated to several sources comes back with slightly
+                # different titles/URLs, so also reject near-duplicates by SimHash distance
+                simhash = self._create_job_simhash(job)
+                if kept_simhashes.has_near(simhash):
+                    continue
+
                 seen_jobs.add(job_hash)
+                kept_simhashes.add(simhash)
                 # Calculate relevance score
-                job['relevance_score'] = self._calculate_relevance(job, job_role)
+                job['relevance_score'] = self._calculate_relevance(job, job_role_lower, role_keywords, today)
                 unique_jobs.append(job)
         
         # Sort by relevance score (descending)
@@ -1824,53 +2759,55 @@ class JobSearchEngine:
         
         return unique_jobs[:50]  # Limit to top 50 jobs
     
-    def _create_job_hash(self, job: Dict) -> str:
-        """Create a hash for job deduplication"""
+    def _create_job_hash(self, job: Dict) -> Tuple[str, str]:
+        """Create a key for job deduplication
+
+        The normalized (title, company) pair is itself the set key - hashing it again
+        through md5 only cost time, and the tuple can't collide the way a joined string can.
+        """
         title = job.get('title', '').lower().strip()
         company = job.get('company', '').lower().strip()
         
         # Normalize title
-        title = re.sub(r'[^\w\s]', '', title)
-        title = re.sub(r'\s+', ' ', title)
+        title = _NON_WORD_RE.sub('', title)
+        title = _WHITESPACE_RE.sub(' ', title)
         
-        # Create hash
-        hash_string = f"{title}_{company}"
-        return hashlib.md5(hash_string.encode()).hexdigest()
+        return title, company
+
+    def _create_job_simhash(self, job: Dict) -> int:
+        """Create a SimHash over the title, company and location tokens"""
+        text = f"{job.get('title', '')} {job.get('company', '')} {job.get('location', '')}"
+        return _simhash(_TOKEN_RE.findall(text.lower()))
     
     def _is_valid_job(self, job: Dict) -> bool:
         """Check if job has valid data"""
         required_fields = ['title', 'company', 'url']
         return all(job.get(field) and job.get(field).strip() for field in required_fields)
     
-    def _calculate_relevance(self, job: Dict, job_role: str) -> int:
-        """Calculate relevance score for job"""
+    def _calculate_relevance(self, job: Dict, job_role_lower: str, role_keywords: List[str], today: date) -> int:
+        """Calculate relevance score for job
+
+        The lowercased role, its keywords and today's date are the same for every job
+        in a ranking pass, so the caller works them out once.
+        """
         score = 0
         title = job.get('title', '').lower()
         description = job.get('description', '').lower()
-        job_role_lower = job_role.lower()
         
         # Title matching (highest priority)
         if job_role_lower in title:
             score += 20
         
         # Keywords matching
-        keywords = job_role_lower.split()
-        for keyword in keywords:
+        for keyword in role_keywords:
             if keyword in title:
                 score += 8
             if keyword in description:
                 score += 3
         
         # AI/ML specific keywords
-        ai_ml_keywords = ['ai', 'ml', 'machine learning', 'artificial intelligence', 
-                         'deep learning', 'neural network', 'nlp', 'computer vision',
-                         'data science', 'tensorflow', 'pytorch']
-        
-        for keyword in ai_ml_keywords:
-            if keyword in title:
-                score += 10
-            if keyword in description:
-                score += 5
+        score += 10 * _RELEVANCE_AI_ML_KEYWORDS.count(title)
+        score += 5 * _RELEVANCE_AI_ML_KEYWORDS.count(description)
         
         # Source preference (LinkedIn and Naukri are popular in India)
         source = job.get('source', '').lower()
@@ -1883,7 +2820,7 @@ class JobSearchEngine:
         
         # Experience level matching for freshers
         exp_level = job.get('experience_level', '').lower()
-        if any(word in exp_level for word in ['entry', 'fresher', '0-1', 'graduate']):
+        if _FRESHER_LEVEL_KEYWORDS.search(exp_level):
             score += 10
         
         # Job type preference
@@ -1894,17 +2831,13 @@ class JobSearchEngine:
             score += 3
         
         # Recent jobs get higher score
-        try:
-            posted_date = job.get('posted_date', '')
-            if posted_date:
-                job_date = datetime.strptime(posted_date, '%Y-%m-%d')
-                days_old = (datetime.now() - job_date).days
-                if days_old <= 7:
-                    score += 8
-                elif days_old <= 30:
-                    score += 4
-        except:
-            pass
+        posted_date = job.get('posted_date', '')
+        days_old = _days_since_posted(posted_date, today) if posted_date and isinstance(posted_date, str) else None
+        if days_old is not None:
+            if days_old <= 7:
+                score += 8
+            elif days_old <= 30:
+                score += 4
         
         return score
     
@@ -1912,14 +2845,20 @@ class JobSearchEngine:
         """Generate search summary statistics"""
         total_jobs = results.get('total_jobs', 0)
         sources = results.get('sources', {})
+        all_jobs = results.get('all_jobs', [])
+
+        # One pass pulls out the summarized fields; each column is then counted in C
+        columns = [(job.get('company', 'Unknown'), job.get('job_type', 'Unknown'), job.get('experience_level', 'Unknown'))
+                   for job in all_jobs]
+        companies, job_types, exp_levels = zip(*columns) if columns else ((), (), ())
         
         summary = {
             'total_jobs_found': total_jobs,
             'sources_searched': len(sources),
             'source_breakdown': {},
-            'top_companies': self._get_top_companies(results.get('all_jobs', [])),
-            'job_types': self._get_job_type_distribution(results.get('all_jobs', [])),
-            'experience_levels': self._get_experience_distribution(results.get('all_jobs', [])),
+            'top_companies': self._get_top_companies(companies),
+            'job_types': self._get_job_type_distribution(job_types),
+            'experience_levels': self._get_experience_distribution(exp_levels),
             'search_timestamp': results.get('timestamp')
         }
         
@@ -1929,110 +2868,61 @@ class JobSearchEngine:
         
         return summary
     
-    def _get_top_companies(self, jobs: List[Dict], limit: int = 10) -> List[Dict]:
-        """Get top hiring companies"""
-        company_count = {}
-        for job in jobs:
-            company = job.get('company', 'Unknown')
-            if company != 'Company Not Specified' and company != 'Unknown':
-                company_count[company] = company_count.get(company, 0) + 1
+    def _get_top_companies(self, companies: Iterable[str], limit: int = 10) -> List[Dict]:
+        """Get top hiring companies from the jobs' company names"""
+        company_count = Counter(companies)
+        company_count.pop('Company Not Specified', None)
+        company_count.pop('Unknown', None)
         
         return [{'company': company, 'job_count': count} 
-                for company, count in sorted(company_count.items(), 
-                key=lambda x: x[1], reverse=True)[:limit]]
+                for company, count in company_count.most_common(limit)]
     
-    def _get_job_type_distribution(self, jobs: List[Dict]) -> Dict[str, int]:
+    def _get_job_type_distribution(self, job_types: Iterable[str]) -> Dict[str, int]:
         """Get job type distribution"""
-        job_types = {}
-        for job in jobs:
-            job_type = job.get('job_type', 'Unknown')
-            job_types[job_type] = job_types.get(job_type, 0) + 1
-        return job_types
+        return dict(Counter(job_types))
     
-    def _get_experience_distribution(self, jobs: List[Dict]) -> Dict[str, int]:
+    def _get_experience_distribution(self, exp_levels: Iterable[str]) -> Dict[str, int]:
         """Get experience level distribution"""
-        exp_levels = {}
-        for job in jobs:
-            exp_level = job.get('experience_level', 'Unknown')
-            exp_levels[exp_level] = exp_levels.get(exp_level, 0) + 1
-        return exp_levels
+        return dict(Counter(exp_levels))
     
     def analyze_job_market(self, job_role: str, search_results: Dict) -> Dict:
-        """Analyze job market trends using Gemini AI"""
-        try:
-            # Use direct API call to Gemini
-            url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-1.5-flash:generateContent?key={GEMINI_API_KEY}"
-            
-            # Prepare data for analysis
-            job_data = {
-                'total_jobs': search_results.get('total_jobs', 0),
-                'sources': list(search_results.get('sources', {}).keys()),
-                'sample_jobs': search_results.get('all_jobs', [])[:5],  # Sample jobs
-                'summary': search_results.get('summary', {})
-            }
-            
-            prompt = f"""
-            Analyze the job market for "{job_role}" AI/ML positions in Pune for Symbiosis Institute of Technology 4th year students and fresh graduates.
-            
-            Job Search Data Summary:
-            - Total jobs found: {job_data['total_jobs']}
-            - Sources searched: {', '.join(job_data['sources'])}
-            - Sample job titles: {[job.get('title', 'N/A') for job in job_data['sample_jobs'][:3]]}
-            
-            Provide a comprehensive analysis including:
-            
-            ## Market Overview
-            Current demand and supply for {job_role} positions in Pune AI/ML market.
-            
-            ## Salary Expectations
-            Expected salary ranges for fresh graduates in {job_role} positions (in INR/LPA).
-            
-            ## Top Hiring Companies
-            Companies actively hiring for {job_role} roles in Pune.
-            
-            ## Essential Skills
-            Most sought-after technical and soft skills for {job_role} positions.
-            
-            ## Career Growth Path
-            Typical career progression for freshers starting in {job_role}.
-            
-            ## Application Strategy
-            Practical tips to improve chances of getting hired in {job_role}.
-            
-            ## Industry Trends
-            Current AI/ML industry trends affecting {job_role} opportunities.
-            
-            ## Action Items for Students
-            Specific recommendations for SIT Pune students to prepare for {job_role} roles.
-            
-            Keep the analysis practical, actionable, and focused on the Indian job market.
-            """
-            
-            payload = {
-                "contents": [{
-                    "parts": [{"text": prompt}]
-                }]
+        """Analyze job market trends using Gemini AI
+
+        Analyses are cached by role, a coarse job-count bucket and sources searched,
+        so repeating a near-identical search reuses the earlier analysis. Searches
+        with fewer than ANALYSIS_MIN_JOBS jobs give the model too little to go on
+        and get the template analysis straight away.
+        """
+        total_jobs = search_results.get('total_jobs', 0)
+        if total_jobs < ANALYSIS_MIN_JOBS:
+            logger.info("Skipping AI market analysis for %s: only %d jobs", job_role, total_jobs)
+            return {
+                'job_role': job_role,
+                'analysis': self._generate_fallback_analysis(job_role, search_results),
+                'timestamp': now_iso(),
+                'job_count': total_jobs,
+                'data_quality': 'insufficient'
             }
+
+        cache_key = PersistentTTLCache.make_key(
+            _WHITESPACE_RE.sub(' ', job_role).strip().casefold(),
+            min(total_jobs // ANALYSIS_JOB_BUCKET_SIZE, ANALYSIS_JOB_BUCKET_MAX),
+            sorted(search_results.get('sources', {}))
+        )
+
+        try:
+            analysis_text = analysis_cache.get(cache_key)
+            if analysis_text is None:
+                analysis_text = gemini_generate(self._build_market_analysis_prompt(job_role, search_results))
+                analysis_cache.set(cache_key, analysis_text, ANALYSIS_CACHE_TTL)
             
-            headers = {
-                'Content-Type': 'application/json'
+            return {
+                'job_role': job_role,
+                'analysis': analysis_text,
+                'timestamp': now_iso(),
+                'job_count': total_jobs,
+                'data_quality': 'high' if total_jobs > 10 else 'medium'
             }
-            
-            response = requests.post(url, json=payload, headers=headers, timeout=30)
-            
-            if response.status_code == 200:
-                result = response.json()
-                analysis_text = result['candidates'][0]['content']['parts'][0]['text']
-                
-                return {
-                    'job_role': job_role,
-                    'analysis': analysis_text,
-                    'timestamp': datetime.now().isoformat(),
-                    'job_count': search_results.get('total_jobs', 0),
-                    'data_quality': 'high' if search_results.get('total_jobs', 0) > 10 else 'medium'
-                }
-            else:
-                raise Exception(f"Gemini API error: {response.status_code} - {response.text}")
                 
         except Exception as e:
             logger.error(f"Market analysis failed: {e}")
@@ -2040,12 +2930,29 @@ class JobSearchEngine:
             return {
                 'job_role': job_role,
                 'analysis': self._generate_fallback_analysis(job_role, search_results),
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': now_iso(),
                 'job_count': search_results.get('total_jobs', 0),
                 'data_quality': 'limited',
                 'error': str(e)
             }
     
+    def _build_market_analysis_prompt(self, job_role: str, search_results: Dict) -> str:
+        """Gemini prompt asking for a market analysis of job_role from the search results"""
+        # Prepare data for analysis
+        job_data = {
+            'total_jobs': search_results.get('total_jobs', 0),
+            'sources': list(search_results.get('sources', {}).keys()),
+            'sample_jobs': search_results.get('all_jobs', [])[:5],  # Sample jobs
+            'summary': search_results.get('summary', {})
+        }
+
+        return MARKET_ANALYSIS_PROMPT.format(
+            job_role=job_role,
+            total_jobs=job_data['total_jobs'],
+            sources=', '.join(job_data['sources']),
+            sample_titles=[job.get('title', 'N/A') for job in job_data['sample_jobs'][:3]]
+        )
+
     def _generate_fallback_analysis(self, job_role: str, search_results: Dict) -> str:
         """Generate basic analysis when AI fails"""
         total_jobs = search_results.get('total_jobs', 0)
@@ -2083,35 +2990,185 @@ Based on our search across {len(sources)} job portals, we found {total_jobs} rel
 # Initialize job search engine
 job_search_engine = JobSearchEngine()
 
+# Background searches - each kind runs on its own bounded pool, so long interview
+# scrapes can't starve job searches and a burst of requests can't spawn unbounded threads
+SEARCH_BACKLOG = 10   # searches of one kind running or waiting before new ones are refused
+SEARCH_HISTORY = 100  # most recent searches of one kind whose state /search-status can report
+
+class BoundedExecutor:
+    """Thread pool that refuses new work once its backlog is full instead of queueing without limit
+
+    Submitted tasks are tracked by id, so their progress can be looked up after the request returns.
+    """
+
+    def __init__(self, max_workers: int, backlog: int, thread_name_prefix: str, history: int = SEARCH_HISTORY):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+        self._slots = threading.BoundedSemaphore(backlog)
+        self._history = history
+        self._tasks: "OrderedDict[str, Future]" = OrderedDict()
+        self._tasks_lock = threading.Lock()
+
+    def try_submit(self, task_id: str, fn, *args) -> Optional[Future]:
+        """Schedule fn(*args) under task_id, or return None if the backlog is full"""
+        if not self._slots.acquire(blocking=False):
+            return None
+        try:
+            future = self._executor.submit(fn, *args)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        self._track(task_id, future)
+        return future
+
+    def record_completed(self, task_id: str, result=None) -> Future:
+        """Track task_id as already completed with result, for work answered without the pool"""
+        future = Future()
+        future.set_result(result)
+        self._track(task_id, future)
+        return future
+
+    def _track(self, task_id: str, future: Future):
+        with self._tasks_lock:
+            self._tasks[task_id] = future
+            while len(self._tasks) > self._history:
+                self._tasks.popitem(last=False)
+
+    @staticmethod
+    def _state(future: Future) -> str:
+        if future.running():
+            return 'running'
+        if not future.done():
+            return 'queued'
+        if future.cancelled() or future.exception() is not None:
+            return 'failed'
+        return 'completed'
+
+    def task_state(self, task_id: str) -> Optional[str]:
+        """queued, running, completed or failed - None if task_id is unknown or too old"""
+        with self._tasks_lock:
+            future = self._tasks.get(task_id)
+        return self._state(future) if future is not None else None
+
+    def pending_counts(self) -> Dict[str, int]:
+        """Number of tracked tasks currently queued and running"""
+        with self._tasks_lock:
+            states = Counter(self._state(future) for future in self._tasks.values())
+        return {'queued': states['queued'], 'running': states['running']}
+
+def new_search_id(*parts: str) -> str:
+    """Unique id for a background search, readable from its parameters"""
+    return '_'.join((*parts, str(int(time.time())), uuid.uuid4().hex[:8]))
+
+job_search_executor = BoundedExecutor(MAX_WORKERS, SEARCH_BACKLOG, 'job-search')
+interview_search_executor = BoundedExecutor(MAX_WORKERS, SEARCH_BACKLOG, 'interview-search')
+
+def searches_busy_response():
+    """429 response for a search refused because its pool's backlog is full"""
+    return jsonify({'error': 'Too many searches in progress',
+                    'message': 'Please wait before making another request'}), 429
+
+# SerpAPI liveness for /search-status - probed off the request path at most once per
+# interval, so status checks neither wait on nor spend quota on an upstream query
+SERPAPI_PROBE_INTERVAL = 60  # seconds
+# The first status check waits this long for the first probe; if SerpAPI is slower
+# than that it reports 'unknown' until the probe finishes
+SERPAPI_PROBE_FIRST_WAIT = 5  # seconds
+
+class UpstreamProbe:
+    """Last result of a liveness check, refreshed by a background task once it goes stale"""
+
+    def __init__(self, check, interval: float, first_wait: float = 0):
+        self._check = check
+        self.interval = interval
+        self.first_wait = first_wait
+        self._lock = threading.Lock()
+        self._first_result = threading.Event()
+        self._status = 'unknown'
+        self._error: Optional[str] = None
+        self._checked_at: Optional[float] = None
+        self._refreshing = False
+
+    def snapshot(self) -> Dict:
+        """Latest probe result, starting a refresh if it is older than the interval
+
+        Until the first probe has finished, waits up to first_wait seconds for it
+        rather than answering 'unknown'.
+        """
+        with self._lock:
+            stale = self._checked_at is None or time.time() - self._checked_at >= self.interval
+            if stale and not self._refreshing:
+                self._refreshing = True
+                socketio.start_background_task(self._refresh)
+        if not self._first_result.is_set():
+            self._first_result.wait(self.first_wait)
+        with self._lock:
+            return {'status': self._status, 'error': self._error, 'checked_at': self._checked_at}
+
+    def _refresh(self):
+        try:
+            status, error = self._check(), None
+        except Exception as e:
+            status, error = 'error', str(e)
+        with self._lock:
+            self._status, self._error = status, error
+            self._checked_at = time.time()
+            self._refreshing = False
+        self._first_result.set()
+
+def _check_serpapi() -> str:
+    """Run one uncached SerpAPI query and classify the upstream"""
+    test_result = serpapi_search({
+        "engine": "google",
+        "q": "test search",
+        "num": 1
+    }, use_cache=False)
+    return "operational" if test_result else "limited"
+
+serpapi_probe = UpstreamProbe(_check_serpapi, SERPAPI_PROBE_INTERVAL, SERPAPI_PROBE_FIRST_WAIT)
+
+SUPPORTED_SOURCES = ("LinkedIn", "Naukri", "Indeed", "FreshersWorld", "Monster")
+
+# Interview domains accepted by /interview-questions, in the order the error message lists them
+INTERVIEW_DOMAINS = (
+    'DSA', 'SQL', 'OS', 'CN', 'DBMS', 'Machine Learning', 'Deep Learning',
+    'Python', 'Java', 'System Design', 'JavaScript', 'React', 'Node.js',
+    'Cloud Computing', 'DevOps', 'Cybersecurity', 'Blockchain'
+)
+VALID_DOMAINS = frozenset(INTERVIEW_DOMAINS)
+_INVALID_DOMAIN_ERROR = f'Invalid domain. Supported domains: {", ".join(INTERVIEW_DOMAINS)}'
+
+# Static part of the health check, built once rather than on every probe
+API_INFO = MappingProxyType({
+    "message": "🚀 AI/ML Job Search & Interview Prep API for SIT Pune 4th Year Students - Ready",
+    "version": "3.0",
+    "status": "operational",
+    "supported_sources": list(SUPPORTED_SOURCES),
+    "new_features": [
+        "Comprehensive job search across multiple platforms",
+        "Real-time search progress updates",
+        "AI-powered market analysis",
+        "Job relevance scoring",
+        "Interview question search with solutions",
+        "Company-specific interview questions",
+        "PDF generation for interview prep",
+        "India-specific content focus"
+    ],
+    "endpoints": {
+        "/search-jobs": "POST - Search for AI/ML jobs",
+        "/interview-questions": "POST - Search for interview questions",
+        "/generate-interview-pdf": "POST - Generate PDF with interview questions",
+        "/analyze-market": "POST - Get AI-powered market analysis",
+        "/job-suggestions": "GET - Get job role suggestions",
+        "/search-status": "GET - Check search capabilities"
+    }
+})
+
 # Enhanced API Routes
 @app.route("/", methods=["GET"])
 def health_check():
     """Enhanced health check endpoint"""
-    return jsonify({
-        "message": "🚀 AI/ML Job Search & Interview Prep API for SIT Pune 4th Year Students - Ready",
-        "version": "3.0",
-        "timestamp": datetime.now().isoformat(),
-        "status": "operational",
-        "supported_sources": ["LinkedIn", "Naukri", "Indeed", "FreshersWorld", "Monster"],
-        "new_features": [
-            "Comprehensive job search across multiple platforms",
-            "Real-time search progress updates",
-            "AI-powered market analysis",
-            "Job relevance scoring",
-            "Interview question search with solutions",
-            "Company-specific interview questions",
-            "PDF generation for interview prep",
-            "India-specific content focus"
-        ],
-        "endpoints": {
-            "/search-jobs": "POST - Search for AI/ML jobs",
-            "/interview-questions": "POST - Search for interview questions",
-            "/generate-interview-pdf": "POST - Generate PDF with interview questions",
-            "/analyze-market": "POST - Get AI-powered market analysis",
-            "/job-suggestions": "GET - Get job role suggestions",
-            "/search-status": "GET - Check search capabilities"
-        }
-    })
+    return jsonify({**API_INFO, "timestamp": now_iso()})
 
 @app.route("/search-jobs", methods=["POST"])
 def search_jobs():
@@ -2132,22 +3189,21 @@ def search_jobs():
         if len(job_role) < 2:
             return jsonify({'error': 'Job role must be at least 2 characters'}), 400
         
-        logger.info(f"Processing job search: {job_role} in {location}")
+        logger.info("Processing job search: %s in %s", job_role, location)
         
-        # Run search in background thread
-        search_thread = threading.Thread(
-            target=job_search_engine.comprehensive_job_search,
-            args=(job_role, location, filters)
-        )
-        search_thread.daemon = True
-        search_thread.start()
+        # Run search on the job search pool
+        search_id = new_search_id(job_role, location)
+        if job_search_executor.try_submit(search_id, job_search_engine.comprehensive_job_search,
+                                          job_role, location, filters) is None:
+            return searches_busy_response()
         
         return jsonify({
             'message': 'Job search initiated successfully',
+            'search_id': search_id,
             'job_role': job_role,
             'location': location,
             'status': 'in_progress',
-            'timestamp': datetime.now().isoformat()
+            'timestamp': now_iso()
         })
         
     except Exception as e:
@@ -2175,31 +3231,39 @@ def search_interview_questions():
         if len(domain) < 2:
             return jsonify({'error': 'Domain must be at least 2 characters'}), 400
         
-        # Valid domains
-        valid_domains = [
-            'DSA', 'SQL', 'OS', 'CN', 'DBMS', 'Machine Learning', 'Deep Learning',
-            'Python', 'Java', 'System Design', 'JavaScript', 'React', 'Node.js',
-            'Cloud Computing', 'DevOps', 'Cybersecurity', 'Blockchain'
-        ]
+        if domain not in VALID_DOMAINS:
+            return jsonify({'error': _INVALID_DOMAIN_ERROR}), 400
         
-        if domain not in valid_domains:
+        # A repeat of a recent search is answered from the cache without touching the pool
+        cached = job_search_engine.cached_interview_results(domain, company, difficulty, question_count)
+        if cached is not None:
+            logger.info("Serving cached interview questions: %s for %s", domain, company or 'All Companies')
+            search_id = new_search_id(domain, company or 'general')
+            interview_search_executor.record_completed(search_id)
+            queue_event('interview_search_completed', cached, final=True)
             return jsonify({
-                'error': f'Invalid domain. Supported domains: {", ".join(valid_domains)}'
-            }), 400
+                'message': 'Interview questions served from recent search',
+                'search_id': search_id,
+                'domain': domain,
+                'company': company,
+                'difficulty': difficulty,
+                'total_questions': cached['total_questions'],
+                'status': 'completed',
+                'cache': 'hit',
+                'timestamp': now_iso()
+            })
         
-        logger.info(f"Processing enhanced interview question search: {domain} for {company or 'All Companies'}")
+        logger.info("Processing enhanced interview question search: %s for %s", domain, company or 'All Companies')
         
-        # Run search in background thread
-        search_thread = threading.Thread(
-            target=job_search_engine.search_interview_questions,
-            args=(domain, company, difficulty, question_count)
-        )
-        search_thread.daemon = True
-        search_thread.start()
+        # Run search on the interview search pool
+        search_id = new_search_id(domain, company or 'general')
+        if interview_search_executor.try_submit(search_id, job_search_engine.search_interview_questions,
+                                                domain, company, difficulty, question_count) is None:
+            return searches_busy_response()
         
         return jsonify({
             'message': 'Enhanced interview question search initiated successfully',
-            'search_id': f"{domain}_{company or 'general'}_{int(time.time())}",
+            'search_id': search_id,
             'domain': domain,
             'company': company,
             'difficulty': difficulty,
@@ -2214,7 +3278,7 @@ def search_interview_questions():
                 'Recent questions (2022-2024)',
                 'Source credibility scoring'
             ],
-            'timestamp': datetime.now().isoformat()
+            'timestamp': now_iso()
         })
         
     except Exception as e:
@@ -2222,6 +3286,40 @@ def search_interview_questions():
         return jsonify({'error': f'Interview question search failed: {str(e)}'}), 500
 
 
+PDF_QUESTION_FIELDS = ('question', 'domain')
+PDF_MAX_AGE = 86400  # seconds a client may reuse a downloaded report before revalidating
+
+# Download filenames come from user input - spaces and path separators become
+# underscores and anything else outside a safe ASCII set is dropped
+_FILENAME_TABLE = str.maketrans({' ': '_', '/': '_', '\\': '_'})
+_FILENAME_UNSAFE_RE = re.compile(r'[^a-z0-9_.-]')
+
+def _filename_part(text: str) -> str:
+    """Lowercase text made safe to embed in a download filename"""
+    return _FILENAME_UNSAFE_RE.sub('', text.lower().translate(_FILENAME_TABLE))
+
+def _select_pdf_questions(questions: List, difficulty_filter: str) -> Tuple[List[Dict], List[Dict]]:
+    """Validate questions and apply the (already lowercased) difficulty filter in a single pass
+
+    Returns the questions to render and every validation error found, so a client
+    can fix them all at once rather than one per round trip.
+    """
+    selected = []
+    errors = []
+    for i, question in enumerate(questions, 1):
+        if not isinstance(question, dict):
+            errors.append({'index': i, 'field': None, 'message': f'Question {i} must be a dictionary'})
+            continue
+        if difficulty_filter != 'all' and str(question.get('difficulty') or '').lower() != difficulty_filter:
+            continue
+        missing = [field for field in PDF_QUESTION_FIELDS if not question.get(field)]
+        if missing:
+            errors.extend({'index': i, 'field': field, 'message': f'Question {i} missing required field: {field}'}
+                          for field in missing)
+        else:
+            selected.append(question)
+    return selected, errors
+
 @app.route("/generate-interview-pdf", methods=["POST"])
 def generate_interview_pdf():
     """Enhanced PDF generation for interview questions"""
@@ -2234,7 +3332,7 @@ def generate_interview_pdf():
         questions = data.get('questions', [])
         company = data.get('company', '').strip() or None
         include_solutions = data.get('include_solutions', True)
-        difficulty_filter = data.get('difficulty_filter', 'all')  # all, easy, medium, hard
+        difficulty_filter = data.get('difficulty_filter', 'all').lower()  # all, easy, medium, hard
         
         # Validation
         if not domain:
@@ -2243,42 +3341,50 @@ def generate_interview_pdf():
         if not questions:
             return jsonify({'error': 'Questions list is required'}), 400
         
-        # Filter questions by difficulty if specified
-        if difficulty_filter != 'all':
-            questions = [q for q in questions if q.get('difficulty', '').lower() == difficulty_filter.lower()]
-        
-        # Validate question structure
-        for i, question in enumerate(questions):
-            if not isinstance(question, dict):
-                return jsonify({'error': f'Question {i+1} must be a dictionary'}), 400
-            
-            required_fields = ['question', 'domain']
-            for field in required_fields:
-                if not question.get(field):
-                    return jsonify({'error': f'Question {i+1} missing required field: {field}'}), 400
+        # Validate question structure and filter by difficulty if specified
+        questions, errors = _select_pdf_questions(questions, difficulty_filter)
+        if errors:
+            return jsonify({'error': errors[0]['message'], 'errors': errors}), 400
         
-        logger.info(f"Generating enhanced PDF for {domain} - {len(questions)} questions")
+        # The ETag identifies the report spec, so a client revalidating a PDF it already
+        # holds gets a 304 before anything is rendered
+        etag = PersistentTTLCache.make_key(domain, questions, company, include_solutions, difficulty_filter)
+        if etag in request.if_none_match:
+            response = Response(status=304)
+            response.set_etag(etag)
+            return response
         
-        # Generate enhanced PDF
-        pdf_buffer = job_search_engine.pdf_generator.generate_enhanced_pdf(
-            domain, questions, company, include_solutions, difficulty_filter
-        )
+        logger.info("Generating enhanced PDF for %s - %d questions", domain, len(questions))
         
-        # Prepare filename
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"interview_prep_{domain.lower().replace(' ', '_')}"
-        if company:
-            filename += f"_{company.lower().replace(' ', '_')}"
-        if difficulty_filter != 'all':
-            filename += f"_{difficulty_filter}"
-        filename += f"_{timestamp}.pdf"
-        
-        return send_file(
-            pdf_buffer,
-            as_attachment=True,
-            download_name=filename,
-            mimetype='application/pdf'
-        )
+        # Generate enhanced PDF in the worker pool
+        pdf = run_pdf_job(build_enhanced_pdf, domain, questions, company, include_solutions, difficulty_filter,
+                          discard=discard_pdf)
+
+        try:
+            # Prepare filename
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            filename = f"interview_prep_{_filename_part(domain)}"
+            company_part = _filename_part(company) if company else ''
+            if company_part:
+                filename += f"_{company_part}"
+            if difficulty_filter != 'all':
+                filename += f"_{_filename_part(difficulty_filter)}"
+            filename += f"_{timestamp}.pdf"
+
+            if isinstance(pdf, bytes):
+                return send_file(io.BytesIO(pdf), as_attachment=True, download_name=filename,
+                                 mimetype='application/pdf', conditional=True, etag=etag, max_age=PDF_MAX_AGE)
+
+            # Large report spilled to disk by the worker - stream it, removing it once sent
+            size = os.path.getsize(pdf)
+            response = send_file(DeleteOnCloseFile(pdf), as_attachment=True, download_name=filename,
+                                 mimetype='application/pdf', conditional=True, etag=etag, max_age=PDF_MAX_AGE)
+            response.content_length = size
+            return response
+        except Exception:
+            # A spooled report that fails to send would otherwise stay on disk
+            discard_pdf(pdf)
+            raise
         
     except Exception as e:
         logger.error(f"Enhanced PDF generation error: {str(e)}")
@@ -2306,7 +3412,18 @@ def analyze_market():
         if not search_results:
             return jsonify({'error': 'Search results are required for analysis'}), 400
         
-        logger.info(f"Analyzing job market for: {job_role}")
+        # The job count and source names feed the cache key and the prompt
+        if not isinstance(search_results, dict):
+            return jsonify({'error': 'Search results must be an object'}), 400
+
+        total_jobs = search_results.get('total_jobs', 0)
+        if type(total_jobs) is not int or total_jobs < 0:
+            return jsonify({'error': 'search_results.total_jobs must be a non-negative integer'}), 400
+
+        if not isinstance(search_results.get('sources', {}), dict):
+            return jsonify({'error': 'search_results.sources must be an object keyed by source name'}), 400
+
+        logger.info("Analyzing job market for: %s", job_role)
         
         analysis = job_search_engine.analyze_job_market(job_role, search_results)
         return jsonify(analysis)
@@ -2315,120 +3432,129 @@ def analyze_market():
         logger.error(f"Market analysis error: {str(e)}")
         return jsonify({'error': f'Analysis failed: {str(e)}'}), 500
 
+# The suggestions never change, so they are serialized once and served with an
+# ETag - repeat visits revalidate with a 304 instead of re-downloading
+JOB_SUGGESTIONS = {
+    'categories': {
+        'core_ai_ml': {
+            'title': 'Core AI/ML Roles',
+            'roles': [
+                {'role': 'AI Engineer', 'description': 'Design and implement AI systems'},
+                {'role': 'Machine Learning Engineer', 'description': 'Build and deploy ML models'},
+                {'role': 'Data Scientist', 'description': 'Extract insights from data using ML'},
+                {'role': 'Deep Learning Engineer', 'description': 'Specialize in neural networks'}
+            ]
+        },
+        'specialized_ai': {
+            'title': 'Specialized AI Roles',
+            'roles': [
+                {'role': 'NLP Specialist', 'description': 'Natural Language Processing expert'},
+                {'role': 'Computer Vision Engineer', 'description': 'Image and video analysis'},
+                {'role': 'Robotics Engineer', 'description': 'AI-powered robotics systems'},
+                {'role': 'AI Research Assistant', 'description': 'Support AI research projects'}
+            ]
+        },
+        'data_roles': {
+            'title': 'Data-Focused Roles',
+            'roles': [
+                {'role': 'Data Analyst', 'description': 'Analyze data for business insights'},
+                {'role': 'Data Engineer', 'description': 'Build data pipelines and infrastructure'},
+                {'role': 'Business Intelligence Analyst', 'description': 'Create data-driven reports'},
+                {'role': 'Quantitative Analyst', 'description': 'Mathematical modeling for finance'}
+            ]
+        },
+        'product_tech': {
+            'title': 'Product & Technology',
+            'roles': [
+                {'role': 'AI Product Manager', 'description': 'Manage AI product development'},
+                {'role': 'ML Ops Engineer', 'description': 'Deploy and maintain ML systems'},
+                {'role': 'AI Ethics Researcher', 'description': 'Ensure responsible AI development'},
+                {'role': 'Technical AI Writer', 'description': 'Document AI systems and research'}
+            ]
+        }
+    },
+    'interview_domains': [
+        'NLP',
+        'Computer Vision',
+        'Machine Learning',
+        'Deep Learning',
+        'Data Science',
+        'AI Ethics',
+        'Robotics',
+        'Data Analysis',
+        'Python Programming',
+        'Statistics',
+        'Algorithms',
+        'System Design'
+    ],
+    'trending_skills': [
+        'Python Programming',
+        'TensorFlow/PyTorch',
+        'Machine Learning Algorithms',
+        'Deep Learning',
+        'Natural Language Processing',
+        'Computer Vision',
+        'SQL and Databases',
+        'Cloud Platforms (AWS/Azure/GCP)',
+        'Docker & Kubernetes',
+        'Git Version Control'
+    ],
+    'entry_level_tips': [
+        'Start with foundational Python and statistics',
+        'Build a portfolio of ML projects on GitHub',
+        'Complete online courses from reputable platforms',
+        'Participate in Kaggle competitions',
+        'Apply for internships to gain practical experience',
+        'Network with AI/ML professionals on LinkedIn',
+        'Prepare for technical interviews with coding practice',
+        'Stay updated with latest AI/ML research and trends'
+    ]
+}
+_JOB_SUGGESTIONS_BODY = orjson.dumps(JOB_SUGGESTIONS, option=orjson.OPT_SORT_KEYS)
+_JOB_SUGGESTIONS_ETAG = hashlib.md5(_JOB_SUGGESTIONS_BODY).hexdigest()
+SUGGESTIONS_MAX_AGE = 3600  # seconds
+
 @app.route("/job-suggestions", methods=["GET"])
 def job_suggestions():
     """Enhanced job role suggestions for AI/ML"""
-    suggestions = {
-        'categories': {
-            'core_ai_ml': {
-                'title': 'Core AI/ML Roles',
-                'roles': [
-                    {'role': 'AI Engineer', 'description': 'Design and implement AI systems'},
-                    {'role': 'Machine Learning Engineer', 'description': 'Build and deploy ML models'},
-                    {'role': 'Data Scientist', 'description': 'Extract insights from data using ML'},
-                    {'role': 'Deep Learning Engineer', 'description': 'Specialize in neural networks'}
-                ]
-            },
-            'specialized_ai': {
-                'title': 'Specialized AI Roles',
-                'roles': [
-                    {'role': 'NLP Specialist', 'description': 'Natural Language Processing expert'},
-                    {'role': 'Computer Vision Engineer', 'description': 'Image and video analysis'},
-                    {'role': 'Robotics Engineer', 'description': 'AI-powered robotics systems'},
-                    {'role': 'AI Research Assistant', 'description': 'Support AI research projects'}
-                ]
-            },
-            'data_roles': {
-                'title': 'Data-Focused Roles',
-                'roles': [
-                    {'role': 'Data Analyst', 'description': 'Analyze data for business insights'},
-                    {'role': 'Data Engineer', 'description': 'Build data pipelines and infrastructure'},
-                    {'role': 'Business Intelligence Analyst', 'description': 'Create data-driven reports'},
-                    {'role': 'Quantitative Analyst', 'description': 'Mathematical modeling for finance'}
-                ]
-            },
-            'product_tech': {
-                'title': 'Product & Technology',
-                'roles': [
-                    {'role': 'AI Product Manager', 'description': 'Manage AI product development'},
-                    {'role': 'ML Ops Engineer', 'description': 'Deploy and maintain ML systems'},
-                    {'role': 'AI Ethics Researcher', 'description': 'Ensure responsible AI development'},
-                    {'role': 'Technical AI Writer', 'description': 'Document AI systems and research'}
-                ]
-            }
-        },
-        'interview_domains': [
-            'NLP',
-            'Computer Vision', 
-            'Machine Learning',
-            'Deep Learning',
-            'Data Science',
-            'AI Ethics',
-            'Robotics',
-            'Data Analysis',
-            'Python Programming',
-            'Statistics',
-            'Algorithms',
-            'System Design'
-        ],
-        'trending_skills': [
-            'Python Programming',
-            'TensorFlow/PyTorch',
-            'Machine Learning Algorithms',
-            'Deep Learning',
-            'Natural Language Processing',
-            'Computer Vision',
-            'SQL and Databases',
-            'Cloud Platforms (AWS/Azure/GCP)',
-            'Docker & Kubernetes',
-            'Git Version Control'
-        ],
-        'entry_level_tips': [
-            'Start with foundational Python and statistics',
-            'Build a portfolio of ML projects on GitHub',
-            'Complete online courses from reputable platforms',
-            'Participate in Kaggle competitions',
-            'Apply for internships to gain practical experience',
-            'Network with AI/ML professionals on LinkedIn',
-            'Prepare for technical interviews with coding practice',
-            'Stay updated with latest AI/ML research and trends'
-        ]
-    }
-    
-    return jsonify(suggestions)
+    response = Response(_JOB_SUGGESTIONS_BODY, mimetype='application/json')
+    response.set_etag(_JOB_SUGGESTIONS_ETAG)
+    response.cache_control.public = True
+    response.cache_control.max_age = SUGGESTIONS_MAX_AGE
+    return response.make_conditional(request)
 
 @app.route("/search-status", methods=["GET"])
 def search_status():
-    """Check search system status"""
+    """Check search system status, or the progress of one search given ?search_id="""
+    search_id = request.args.get('search_id')
+    if search_id:
+        state = job_search_executor.task_state(search_id) or interview_search_executor.task_state(search_id)
+        if state is None:
+            return jsonify({'error': 'Unknown search_id', 'search_id': search_id}), 404
+        return jsonify({'search_id': search_id, 'status': state, 'timestamp': now_iso()})
+
     try:
-        # Test SerpAPI connection
-        test_search = GoogleSearch({
-            "api_key": SERPAPI_API_KEY,
-            "engine": "google",
-            "q": "test search",
-            "num": 1
-        })
-        
-        test_result = test_search.get_dict()
-        serpapi_status = "operational" if test_result else "limited"
-        
+        # A failed probe is reported in the body - the API itself is still answering
+        probe = serpapi_probe.snapshot()
+        checked_at = probe['checked_at']
         status = {
             'system_status': 'operational',
-            'serpapi_status': serpapi_status,
-            'supported_sources': {
-                'LinkedIn': 'operational',
-                'Naukri': 'operational',
-                'Indeed': 'operational',
-                'FreshersWorld': 'operational',
-                'Monster': 'operational'
-            },
+            'serpapi_status': probe['status'],
+            'serpapi_error': probe['error'],
+            'serpapi_checked_at': datetime.fromtimestamp(checked_at).isoformat() if checked_at else None,
+            'serpapi_status_age': int(time.time() - checked_at) if checked_at else None,
+            'supported_sources': dict.fromkeys(SUPPORTED_SOURCES, 'operational'),
             'interview_features': {
                 'question_search': 'operational',
                 'pdf_generation': 'operational',
                 'ai_solutions': 'operational'
             },
             'ai_analysis': 'operational',
-            'last_check': datetime.now().isoformat(),
+            'active_searches': {
+                'jobs': job_search_executor.pending_counts(),
+                'interviews': interview_search_executor.pending_counts()
+            },
+            'last_check': now_iso(),
             'rate_limits': {
                 'requests_per_minute': 30,
                 'concurrent_searches': MAX_WORKERS
@@ -2442,7 +3568,7 @@ def search_status():
         return jsonify({
             'system_status': 'degraded',
             'error': str(e),
-            'last_check': datetime.now().isoformat()
+            'last_check': now_iso()
         }), 500
 
 # WebSocket Event Handlers
@@ -2452,7 +3578,7 @@ def handle_connect():
     logger.info("Client connected to WebSocket")
     emit('connected', {
         'message': '🤖 Neural network synchronized - AI Job Search & Interview Prep System Ready',
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': now_iso(),
         'features': [
             'Real-time job search updates', 
             'AI-powered market analysis', 
@@ -2471,7 +3597,7 @@ def handle_disconnect():
 @socketio.on('ping')
 def handle_ping():
     """Handle ping for connection testing"""
-    emit('pong', {'timestamp': datetime.now().isoformat()})
+    emit('pong', {'timestamp': now_iso()})
 
 # Error Handlers
 @app.errorhandler(404)
@@ -2498,7 +3624,7 @@ def handle_interview_search_started(data):
         'stage': 'started',
         'message': f"🚀 Starting interview question search for {data.get('domain', 'N/A')}",
         'progress': 0,
-        'timestamp': datetime.now().isoformat()
+        'timestamp': now_iso()
     })
 
 @socketio.on('question_extracted')
@@ -2509,16 +3635,26 @@ def handle_question_extracted(data):
         'source': data.get('source', ''),
         'company': data.get('company', ''),
         'difficulty': data.get('difficulty', ''),
-        'timestamp': datetime.now().isoformat()
+        'timestamp': now_iso()
     })
 
+SOLUTION_PREVIEW_CHARS = 100
+
 @socketio.on('solution_generated')
 def handle_solution_generated(data):
-    """Handle AI solution generation"""
+    """Handle AI solution generation
+
+    Producers should send only a solution_preview, which is passed through as-is, so full
+    solutions don't travel over the socket just to be cut down here. A full solution is
+    still accepted and truncated to SOLUTION_PREVIEW_CHARS.
+    """
+    preview = data.get('solution_preview')
+    if preview is None:
+        preview = data.get('solution', '')[:SOLUTION_PREVIEW_CHARS] + '...'
     emit('solution_ready', {
         'question_id': data.get('question_id', ''),
-        'solution_preview': data.get('solution', '')[:100] + '...',
-        'timestamp': datetime.now().isoformat()
+        'solution_preview': preview,
+        'timestamp': now_iso()
     })
 
 # Main application runner
@@ -2533,6 +3669,7 @@ if __name__ == '__main__':
     print("=" * 70)
     
     try:
+        warm_pdf_workers()
         socketio.run(
             app, 
             debug=False,  # Set to False for production